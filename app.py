@@ -1,12 +1,15 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from pathlib import Path
+from collections import namedtuple
 import ast
+import functools
+import json
+import re
 import plotly.express as px
 import plotly.graph_objs as go
-from collections import Counter
 from plotly.subplots import make_subplots
-import random
 
 # Set page configuration
 st.set_page_config(
@@ -19,300 +22,183 @@ st.set_page_config(
 # Define paths
 DATA_DIR = Path("data/processed")
 FIGURES_DIR = Path("results/figures")
+STYLES_PATH = Path("static/styles.css")
 
-# Custom CSS with modern styling
-st.markdown("""
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.3/css/all.min.css">
-""", unsafe_allow_html=True)
+# Upper bound on points sent to the browser for the job postings time series
+MAX_TIME_SERIES_POINTS = 180
 
+# Pages that use the full and analyst-only datasets; every page uses the filtered jobs
+ALL_JOBS_PAGES = {"Overview", "Data"}
+ANALYST_JOBS_PAGES = {"Overview", "Skills Analysis", "Data"}
 
-CUSTOM_CSS = """
-<style>
-@keyframes revealText {
-    from {
-        background-size: 0% 100%;
-    }
-    to {
-        background-size: 100% 100%;
-    }
-}
-/* Main header with gradient */
-.main-header {
-    font-size: 2.5rem;
-    font-weight: bold;
-    font-family: "Inter", sans-serif;
-    background: linear-gradient(to right, #07efeb, #1ec4dc, #369acd, #4d6fbe, #6644af);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    background-repeat: no-repeat;
-    background-size: 100% 100%;
-    animation: revealText 1.5s ease-out forwards;
-    text-align: left;
-    display: inline-block;
-}
-
-/* Section headers */
-.section-header {
-    font-size: 1.5rem;
-    font-weight: bold;
-    font-family: "Inter", sans-serif;
-    color: #3d5169; 
-    padding-top: 1rem;
-    margin-bottom: 1rem;
-}
-.subsection-header {
-    font-size: 1.3rem;
-    font-family: "Inter", sans-serif;
-    color: #506278; 
-    padding-top: 0.5rem;
-}
-
-/* Category tags */
-.category-label {
-    display: inline-block;
-    padding: 4px 8px;
-    margin: 3px;
-    border-radius: 12px;
-    font-size: 0.8rem;
-    font-family: "Inter", sans-serif;
-    background-color: #eaecef;
-    color: #506278;
-}
-.category-label:hover {
-    background-color: #d0d7de;
-}
-
-/* About section on overview page */
-.about-section {
-    background-color: #f8f9fa;
-    border-radius: 10px;
-    padding: 20px;
-    height: 100%;
-    box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-    border: 1px solid rgba(0,0,0,0.03);
-}
-.about-section h2 {
-    color: #3d5169;
-    margin-bottom: 15px;
-    font-family: "Inter", sans-serif;
-    font-size: 1.5rem;
-}
-.about-section p, .about-section ul {
-    color: #506278;
-    margin-bottom: 15px;
-    font-family: "Inter", sans-serif;
-}
-
-/* Metric cards */
-.metric-container {
-    background-color: white;
-    border-radius: 12px;
-    padding: 15px;
-    box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    transition: transform 0.3s ease, box-shadow 0.3s ease;
-    height: 100px;
-    display: flex;
-    flex-direction: row;
-    align-items: center;
-    gap: 20px;
-    text-align: left;
-}
-.metric-container:hover {
-    transform: translateY(-5px);
-    box-shadow: 0 6px 8px rgba(0, 0, 0, 0.15);
-}  
-.metric-value-container {
-    display: flex;
-    align-items: center;
-    gap: 10px;
-}  
-.metric-icon {
-    font-size: 28px;
-    opacity: 0.9;
-}     
-.metric-title {
-    font-weight: 500;
-    color: #757982;
-    font-family: "Inter", sans-serif;
-    font-size: 14px;
-}
-.metric-value {
-    font-size: 24px;
-    font-family: "Inter", sans-serif;
-    color: 	#113768;
-    font-weight: bold;
-} 
-/* Custom color gradient for icons */
-.container-1 .metric-icon { color: #07efeb; }
-.container-2 .metric-icon { color: #1ec4dc; }
-.container-3 .metric-icon { color: #369acd; }
-.container-4 .metric-icon { color: #4d6fbe; }
-.container-5 .metric-icon { color: #6644af; } 
-
-.metric-card {
-    background-color: white;
-    border-radius: 10px;
-    padding: 15px;
-    box-shadow: 0 2px 10px rgba(0,0,0,0.05);
-    text-align: center;
-    height: 100%;
-    display: flex;
-    flex-direction: column;
-    justify-content: center;
-}
-.metric-card .value {
-    font-size: 2rem;
-    font-weight: bold;
-    font-family: "Inter", sans-serif;
-    color: #113768;
-    margin-bottom: 5px;
-}
-.metric-card .label {
-    color: #757982;
-    font-size: 0.9rem;
-    font-family: "Inter", sans-serif;
-}
-
-/* Modern tabs */
-.stTabs [data-baseweb="tab-list"] {
-    gap: 8px;
-
-}
-.stTabs [data-baseweb="tab"] {
-    height: 40px;
-    border-radius: 8px;
-    padding: 0 16px;
-    background-color: #f8f9fa;
-}
-.stTabs [aria-selected="true"] {
-    background-color: #f0f7fe !important;
-    color: #1E293B !important;
-}
-
-
-/* Filter section */
-.filter-section {
-    background-color: #f8f9fa;
-    border-radius: 10px;
-    padding: 15px;
-    margin-bottom: 20px;
-    box-shadow: 0 2px 5px rgba(0,0,0,0.05);
-}
-
-/* Custom card styling */
-div.card-container {
-    background-color: white;
-    border-radius: 12px;
-    box-shadow: 0 4px 12px rgba(0,0,0,0.08);
-    overflow: hidden;
-    padding-bottom: 15px;
-    height: 100%;
-    margin-bottom: 20px;
-    border: 1px solid rgba(0,0,0,0.05);
-    transition: all 0.3s ease;
-}
-
-div.card-container:hover {
-    transform: translateY(-5px);
-    box-shadow: 0 12px 20px rgba(0,0,0,0.12);
-    border-color: rgba(54, 154, 205, 0.3);
-}
+# Days of the week in display order
+DAYS_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+DAY_DTYPE = pd.CategoricalDtype(DAYS_ORDER, ordered=True)
 
-div.card-image {
-    width: 100%;
-    height: 180px;
-    overflow: hidden;
-    margin-bottom: 10px;
-}
+# Helper function to read the custom stylesheet once per server process
+@st.cache_resource
+def load_css(file_path):
+    return f"<style>{Path(file_path).read_text(encoding='utf-8')}</style>"
 
-div.card-image img {
-    width: 100%;
-    height: 100%;
-    object-fit: cover;
-}
+# Apply custom CSS; style-only HTML is sent to the event container without markdown parsing
+st.html(load_css(STYLES_PATH))
 
-div.card-content h3 {
-    padding: 0 15px;
-    margin-bottom: 5px;
-    color: #3d5169;
-    font-family: "Inter", sans-serif;
-    font-size: 1.4rem;
-}
 
-div.card-content p {
-    padding: 0 15px;
-    color: #506278;
-    font-family: "Inter", sans-serif;
-    font-size: 0.9rem;
-}
-/* Sidebar background */
-[data-testid="stSidebar"] {
-    background-color: #f8f8f8 !important;
-}
-
-/* Hide Streamlit branding */
-#MainMenu {visibility: hidden;}
-footer {visibility: hidden;}
-</style>
-"""
-
-# Apply custom CSS
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+# Helper function to get a file's modification time, used to key cached loads
+def file_mtime(file_path):
+    try:
+        return Path(file_path).stat().st_mtime
+    except OSError:
+        # Let the loader report the missing file
+        return None
 
-# Helper function to load data
-@st.cache_data
+# Helper function to load data; the cache is keyed on the file's mtime so regenerated
+# data files are picked up without restarting the app
 def load_data(file_path):
+    return _read_data(file_path, file_mtime(file_path))
+
+@st.cache_data(show_spinner=False)
+def _read_data(file_path, mtime):
     try:
-        return pd.read_csv(file_path)
+        df = pd.read_csv(file_path, engine="pyarrow")
+        
+        # Parse dates once here instead of on every chart rerun
+        if 'Date' in df.columns:
+            df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+        
+        # Dictionary-encode Location so counts and groupings work on integer codes
+        if 'Location' in df.columns:
+            df['Location'] = df['Location'].astype("category")
+        
+        # Downcast whole-year experience columns to small integers; columns with gaps or
+        # fractional values are left as float64 by to_numeric
+        for col in ('exp_min', 'exp_max'):
+            if col in df.columns:
+                df[col] = pd.to_numeric(df[col], downcast='integer')
+        
+        return df
     except Exception as e:
         st.error(f"Error loading data from {file_path}: {e}")
         return None
 
+# Helper function to render a Plotly chart; static charts skip the browser's zoom/hover handlers
+def show_chart(fig, static=False):
+    st.plotly_chart(
+        fig,
+        use_container_width=True,
+        config={'displayModeBar': not static, 'staticPlot': static}
+    )
+
+# Helper function to render a row of (value, label) metric cards in a single markdown element
+def show_metric_cards(cards):
+    st.markdown(
+        "<div class='metric-row'>"
+        + "".join(
+            f"<div class='metric-card'><div class='value'>{value}</div><div class='label'>{label}</div></div>"
+            for value, label in cards
+        )
+        + "</div>",
+        unsafe_allow_html=True
+    )
+
+# Helper function to show a table one page at a time, so only the visible rows are sent
+# to the browser; the page resets to 1 whenever the number of pages changes
+def show_paginated_dataframe(df, key, page_sizes=(25, 100, 500)):
+    size_col, page_col = st.columns(2)
+    page_size = size_col.selectbox("Rows per page", page_sizes, key=f"{key}_page_size")
+    n_pages = max(1, -(-len(df) // page_size))
+    # Keying the page input on the page count gives a fresh input at page 1 whenever it changes
+    page = page_col.number_input("Page", min_value=1, max_value=n_pages, value=1, step=1, key=f"{key}_page_{n_pages}")
+    st.dataframe(df.iloc[(page - 1) * page_size:page * page_size], use_container_width=True)
+
+# Helper function to parse a single string representation of a list
+def parse_list_string(value):
+    if not (isinstance(value, str) and value.startswith('[')):
+        return []
+    try:
+        # Fast path: skill lists only hold plain quoted names, which JSON can parse
+        return json.loads(value.replace("'", '"'))
+    except ValueError:
+        # Names with embedded apostrophes need the full Python literal parser
+        return ast.literal_eval(value)
+
 # Helper function to convert string representation of lists to actual lists
 def convert_string_to_list(df, columns):
     for col in columns:
         if col in df.columns:
-            df[col] = df[col].apply(lambda x: ast.literal_eval(x) if isinstance(x, str) and x.startswith('[') else [])
+            df[col] = [parse_list_string(x) for x in df[col]]
+    return df
+
+# Helper function to load a dataset with its skill columns parsed into lists once per file
+def load_skill_data(file_path, columns=('Soft Skills', 'Hard Skills', 'Domains')):
+    return _read_skill_data(file_path, file_mtime(file_path), columns)
+
+@st.cache_data(show_spinner=False)
+def _read_skill_data(file_path, mtime, columns):
+    df = _read_data(file_path, mtime)
+    if df is not None:
+        df = convert_string_to_list(df, columns)
     return df
 
 # Helper function to count skills
 def count_skills(df, skills_column):
-    # Flatten the lists of skills and count occurrences
-    all_skills = [skill for skills_list in df[skills_column] for skill in skills_list]
-    skill_counts = Counter(all_skills)
-    
-    # Convert to DataFrame for visualization
-    skill_df = pd.DataFrame(skill_counts.items(), columns=["Skill", "Count"])
-    
-    # Sort by count in descending order
-    return skill_df.sort_values(by="Count", ascending=False)
+    # Flatten the lists of skills and count occurrences (already sorted by count, descending)
+    all_skills = df[skills_column].explode().dropna()
+    return all_skills.value_counts().rename_axis("Skill").reset_index(name="Count")
+
+# Helper function to order value counts busiest first, breaking ties by label so the order
+# does not depend on the column's dtype
+def sort_counts(counts):
+    ranking = pd.DataFrame({'label': counts.index.astype(str), 'count': counts.to_numpy()})
+    order = ranking.sort_values(['count', 'label'], ascending=[False, True], kind='stable').index
+    return counts.iloc[order]
+
+# Shared layout for the single-trace bar charts
+BASE_LAYOUT = dict(
+    template='plotly_white',
+    title_font_size=16,
+    title_font_family="Inter, sans-serif",
+    margin=dict(l=10, r=10, t=50, b=10),
+    plot_bgcolor="white",
+    paper_bgcolor="white",
+    hoverlabel=dict(
+        bgcolor="white",
+        font_size=12,
+        font_family="Inter, sans-serif"
+    )
+)
+
+# Gradient color scales for the skills charts
+SKILL_COLOR_SCALES = {
+    "purple": ('#daceeb', '#b59ed8', '#8f70c3', '#6644af'),
+    "mint": ('#a8e7fb', '#80caeb', '#59aedb', '#3391cb', '#0074b9'),
+    "greens": ('#aaebea', '#86c8c7', '#64a6a6', '#418585', '#1a6666')
+}
 
 # Helper function to create plotly skills chart with improved styling
+@st.cache_data(show_spinner=False)
 def plotly_skills_chart(skill_df, title, color_scheme, top_n=20):
     """Create a Plotly bar chart for skills visualization with modern styling"""
-    # Take only top N skills
-    skill_df_top = skill_df.head(top_n).sort_values(by="Count", ascending=True)
-    
-    # Create gradient colors based on the scheme
-    if color_scheme == "purple":
-        colors=['#daceeb', '#b59ed8', '#8f70c3', '#6644af']
-    elif color_scheme == "mint":
-        colors = ['#a8e7fb', '#80caeb', '#59aedb', '#3391cb', '#0074b9']
-    else:
-        colors = ['#aaebea', '#86c8c7', '#64a6a6', '#418585', '#1a6666']
-    
-    fig = px.bar(
-        skill_df_top, 
-        x="Count", 
-        y="Skill",
+    # Take only top N skills; nlargest sorts descending, so reverse for ascending bars
+    skill_df_top = skill_df.nlargest(top_n, "Count").iloc[::-1]
+    
+    # Sample the gradient once per bar so the browser doesn't interpolate a color axis
+    counts = skill_df_top["Count"].to_numpy(dtype=float)
+    span = counts.max() - counts.min() if len(counts) else 0
+    positions = (counts - counts.min()) / span if span else np.full(len(counts), 0.5)
+    scale = SKILL_COLOR_SCALES.get(color_scheme, SKILL_COLOR_SCALES["greens"])
+    colors = px.colors.sample_colorscale(scale, positions) if len(counts) else []
+    
+    fig = go.Figure(go.Bar(
+        x=skill_df_top["Count"],
+        y=skill_df_top["Skill"],
         orientation='h',
-        title=title,
-        color="Count",
-        color_continuous_scale=colors,
-        text="Count"
-    )
+        marker_color=colors,
+        text=skill_df_top["Count"]
+    ))
     
     fig.update_layout(
+        title=title,
         height=600,
         template='plotly_white',
         title_font_size=16,
@@ -337,35 +223,28 @@ def plotly_skills_chart(skill_df, title, color_scheme, top_n=20):
     
     return fig
 
+@st.cache_data(show_spinner=False)
 def plot_top_job_titles(job_title_counts):
     """Create a Plotly bar chart for top job titles with improved styling"""
-    job_title_counts_top = job_title_counts.nlargest(15).sort_values(ascending=True)
-    
-    fig = px.bar(
-        x=job_title_counts_top.values, 
-        y=job_title_counts_top.index, 
-        orientation='h',
-        title='Top 15 Data-Related Job Titles',
-        labels={'x': 'Number of Job Postings', 'y': 'Job Title'},
-        color_discrete_sequence=['#9c7fca']
-    )
-    
-    fig.update_layout(
-        height=500,
-        template='plotly_white',
-        title_font_size=16,
-        title_font_family="Inter, sans-serif",
-        xaxis_title_font_size=12,
-        yaxis_title_font_size=12,
-        coloraxis_showscale=False,
-        margin=dict(l=10, r=10, t=50, b=10),
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=12,
-            font_family="Inter, sans-serif"
-        )
+    # Top 15 busiest first with ties broken by title, reversed for ascending bars
+    job_title_counts_top = sort_counts(job_title_counts).head(15).iloc[::-1]
+    
+    fig = go.Figure(
+        go.Bar(
+            x=job_title_counts_top.values, 
+            y=job_title_counts_top.index, 
+            orientation='h',
+            marker_color='#9c7fca'
+        ),
+        layout={
+            **BASE_LAYOUT,
+            'height': 500,
+            'title': 'Top 15 Data-Related Job Titles',
+            'xaxis_title': 'Number of Job Postings',
+            'yaxis_title': 'Job Title',
+            'xaxis_title_font_size': 12,
+            'yaxis_title_font_size': 12
+        }
     )
     
     fig.update_traces(
@@ -376,19 +255,27 @@ def plot_top_job_titles(job_title_counts):
     
     return fig
 
+@st.cache_data(show_spinner=False)
 def plot_job_postings_over_time(jobs_by_date):
     """Create a Plotly line chart for job postings over time with improved styling"""
     try:
-        # Format dates to show only day and month
-        jobs_by_date['Date'] = pd.to_datetime(jobs_by_date['Date'])
-        jobs_by_date['FormattedDate'] = jobs_by_date['Date'].dt.strftime('%d-%b')
+        # Bucket long histories into multi-day sums so the browser never gets more than
+        # MAX_TIME_SERIES_POINTS points, and let Plotly pick the ticks in that case
+        show_every_date = len(jobs_by_date) <= MAX_TIME_SERIES_POINTS
+        if not show_every_date:
+            span_days = (jobs_by_date['Date'].max() - jobs_by_date['Date'].min()).days + 1
+            bucket_days = -(-span_days // MAX_TIME_SERIES_POINTS)
+            jobs_by_date = (
+                jobs_by_date.resample(f'{bucket_days}D', on='Date')['JobCount'].sum()
+                .reset_index()
+            )
         
         fig = px.line(
             jobs_by_date, 
-            x='FormattedDate', 
+            x='Date', 
             y='JobCount', 
             title='Job Postings By Date',
-            labels={'FormattedDate': 'Date', 'JobCount': 'Number of Job Postings'},
+            labels={'JobCount': 'Number of Job Postings'},
             markers=True,
             line_shape='linear',
             color_discrete_sequence=['#60e5f7']
@@ -397,7 +284,7 @@ def plot_job_postings_over_time(jobs_by_date):
         # Add area under the line
         fig.add_trace(
             go.Scatter(
-                x=jobs_by_date['FormattedDate'],
+                x=jobs_by_date['Date'],
                 y=jobs_by_date['JobCount'],
                 fill='tozeroy',
                 fillcolor='rgba(54, 154, 205, 0.1)',
@@ -407,12 +294,10 @@ def plot_job_postings_over_time(jobs_by_date):
             )
         )
         
-        # Ensure all dates are shown on x-axis
-        fig.update_xaxes(
-            tickmode='array', 
-            tickvals=jobs_by_date['FormattedDate'],
-            tickangle=270
-        )
+        # Ensure all dates are shown on x-axis, formatted to day and month by Plotly
+        fig.update_xaxes(tickformat='%d-%b', tickangle=270)
+        if show_every_date:
+            fig.update_xaxes(tickmode='array', tickvals=jobs_by_date['Date'])
         
         fig.update_layout(
             height=500,
@@ -432,7 +317,7 @@ def plot_job_postings_over_time(jobs_by_date):
         )
         
         fig.update_traces(
-            hovertemplate='<b>%{x}</b><br>Jobs: %{y}<extra></extra>'
+            hovertemplate='<b>%{x|%d-%b}</b><br>Jobs: %{y}<extra></extra>'
         )
         
         return fig
@@ -448,43 +333,35 @@ def plot_job_postings_over_time(jobs_by_date):
         )
         fig.update_layout(height=300)
         return fig
+@st.cache_data(show_spinner=False)
 def plot_job_postings_by_day(jobs_by_day):
     """Create a Plotly column chart for job postings by day of the week with improved styling"""
     try:
-        # Define the days of the week in order
-        days_order = ['Monday', 'Tuesday', 'Wednesday','Thursday', 'Friday', 'Saturday', 'Sunday']
-        
-        # If your data doesn't have the days in the right order, you can reindex it
+        # Day is an ordered categorical, so sorting orders the weekdays by integer code
         if 'Day' in jobs_by_day.columns:
-            jobs_by_day = jobs_by_day.set_index('Day').reindex(days_order).reset_index()
-        
-        fig = px.bar(
-            jobs_by_day, 
-            y='Day', 
-            x='JobCount', 
-            title='Job Postings by Day of Week',
-            labels={'Day': 'Day of Week', 'JobCount': 'Number of Job Postings'},
-            color_discrete_sequence=['#9c7fca'],
-            category_orders={"Day": days_order}  # Ensure correct order
-        )
+            jobs_by_day = jobs_by_day.sort_values('Day')
         
-        # Update the layout for better appearance
-        fig.update_layout(
-            height=500,
-            template='plotly_white',
-            title_font_size=16,
-            title_font_family="Inter, sans-serif",
-            xaxis_title_font_size=12,
-            yaxis_title_font_size=12,
-            margin=dict(b=100, l=10, r=10, t=50),
-            plot_bgcolor="white",
-            paper_bgcolor="white",
-            bargap=0.25,
-            hoverlabel=dict(
-                bgcolor="white",
-                font_size=12,
-                font_family="Inter, sans-serif"
-            )
+        fig = go.Figure(
+            go.Bar(
+                y=jobs_by_day['Day'], 
+                x=jobs_by_day['JobCount'], 
+                orientation='h',
+                marker_color='#9c7fca'
+            ),
+            layout={
+                **BASE_LAYOUT,
+                'height': 500,
+                'title': 'Job Postings by Day of Week',
+                'xaxis_title': 'Number of Job Postings',
+                'yaxis_title': 'Day of Week',
+                'xaxis_title_font_size': 12,
+                'yaxis_title_font_size': 12,
+                'margin': dict(b=100, l=10, r=10, t=50),
+                'bargap': 0.25,
+                # Ensure correct order, with Monday at the top of the horizontal bars
+                'yaxis_categoryorder': 'array',
+                'yaxis_categoryarray': DAYS_ORDER[::-1]
+            }
         )
         
         # Add data labels on top of bars
@@ -511,40 +388,30 @@ def plot_job_postings_by_day(jobs_by_day):
         )
         fig.update_layout(height=300)
         return fig
+@st.cache_data(show_spinner=False)
 def plot_location_distribution(location_counts):
     """Create an interactive Plotly bar chart for location distribution with improved styling"""
     
     # Sort the data by number of jobs in descending order
     location_counts_sorted = location_counts.sort_values('Number of Jobs', ascending=False)
     
-    fig = px.bar(
-        location_counts_sorted, 
-        x='Number of Jobs', 
-        y='Location',
-        orientation='h',
-        title='Data-Related Jobs by Location',
-        color='Number of Jobs',
-        color_discrete_sequence=px.colors.sequential.Blues[-4:],
-        text='Number of Jobs'
-    )
-    
-    fig.update_layout(
-        height=500,
-        template='plotly_white',
-        title_font_size=16,
-        title_font_family="Inter, sans-serif",
-        xaxis_title="Number of Jobs",
-        yaxis_title="Location",
-        yaxis={'categoryorder': 'total ascending'},
-        coloraxis_showscale=False,
-        margin=dict(l=10, r=10, t=50, b=10),
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        hoverlabel=dict(
-            bgcolor="white",
-            font_size=12,
-            font_family="Inter, sans-serif"
-        )
+    fig = go.Figure(
+        go.Bar(
+            x=location_counts_sorted['Number of Jobs'], 
+            y=location_counts_sorted['Location'],
+            orientation='h',
+            marker=dict(color=location_counts_sorted['Number of Jobs'], coloraxis='coloraxis'),
+            text=location_counts_sorted['Number of Jobs']
+        ),
+        layout={
+            **BASE_LAYOUT,
+            'height': 500,
+            'title': 'Data-Related Jobs by Location',
+            'xaxis_title': "Number of Jobs",
+            'yaxis_title': "Location",
+            'yaxis_categoryorder': 'total ascending',
+            'coloraxis_showscale': False
+        }
     )
     
     fig.update_traces(
@@ -553,6 +420,7 @@ def plot_location_distribution(location_counts):
     )
     
     return fig
+@st.cache_data(show_spinner=False)
 def plot_jobs_level(job_counts):
     """
     Create a donut chart using Plotly for job levels
@@ -604,6 +472,7 @@ def plot_jobs_level(job_counts):
     )
     
     return fig
+@st.cache_data(show_spinner=False)
 def plot_jobs_type(job_type_counts):
     """
     Create a donut chart using Plotly for job type
@@ -655,252 +524,173 @@ def plot_jobs_type(job_type_counts):
     )
     
     return fig
-def create_vietnam_province_map(filtered_jobs):
+
+
+# Coordinates and region of a province or major city
+Province = namedtuple("Province", "lat lon region")
+
+# Vietnam provinces and major cities with coordinates and region
+VIETNAM_PROVINCES = {
+    # Northern Vietnam
+    "Hà Nội": Province(21.0285, 105.8542, "North"),
+    "Hải Phòng": Province(20.8449, 106.6881, "North"),
+    "Thái Nguyên": Province(21.5942, 105.8480, "North"),
+    "Bắc Ninh": Province(21.1861, 106.0763, "North"),
+    "Hạ Long": Province(20.9515, 107.0748, "North"),
+    "Lào Cai": Province(22.4855, 103.9757, "North"),
+    "Điện Biên": Province(21.3856, 103.0321, "North"),
+    "Hải Dương": Province(20.9373, 106.3145, "North"),
+    "Nam Định": Province(20.4345, 106.1680, "North"),
+    "Ninh Bình": Province(20.2478, 105.9743, "North"),
+    "Vĩnh Phúc": Province(21.3608, 105.5474, "North"),
+    "Cao Bằng": Province(22.6666, 106.2639, "North"),
+    "Lạng Sơn": Province(21.8531, 106.7608, "North"),
+    "Bắc Giang": Province(21.2717, 106.1947, "North"),
+    "Thái Bình": Province(20.4462, 106.3366, "North"),
+    "Hà Giang": Province(22.8025, 104.9784, "North"),
+    "Yên Bái": Province(21.7226, 104.9096, "North"),
+    "Phú Thọ": Province(21.4219, 105.2245, "North"),
+    "Tuyên Quang": Province(21.7767, 105.2280, "North"),
+    "Hà Nam": Province(20.5835, 105.9241, "North"),
+    "Bắc Kạn": Province(22.1477, 105.8347, "North"),
+    "Hưng Yên": Province(20.6546, 106.0569, "North"),
+    "Hòa Bình": Province(20.8172, 105.3380, "North"),
+    "Quảng Ninh": Province(21.0064, 107.2925, "North"),
+    "Sơn La": Province(21.1018, 103.7289, "North"),
+    
+    # Central Vietnam
+    "Đà Nẵng": Province(16.0544, 108.2022, "Central"),
+    "Huế": Province(16.4637, 107.5909, "Central"),
+    "Nha Trang": Province(12.2388, 109.1968, "Central"),
+    "Quy Nhơn": Province(13.7829, 109.2196, "Central"),
+    "Đà Lạt": Province(11.9404, 108.4583, "Central"),
+    "Thanh Hóa": Province(19.8068, 105.7852, "Central"),
+    "Nghệ An": Province(19.2339, 104.9200, "Central"),
+    "Hà Tĩnh": Province(18.3559, 105.8877, "Central"),
+    "Quảng Bình": Province(17.4682, 106.6004, "Central"),
+    "Quảng Trị": Province(16.7943, 107.0451, "Central"),
+    "Thừa Thiên Huế": Province(16.4637, 107.5909, "Central"),
+    "Quảng Nam": Province(15.5394, 108.0191, "Central"),
+    "Quảng Ngãi": Province(15.1213, 108.7953, "Central"),
+    "Bình Định": Province(13.7829, 109.2196, "Central"),
+    "Phú Yên": Province(13.0881, 109.0928, "Central"),
+    "Khánh Hòa": Province(12.2388, 109.1968, "Central"),
+    "Ninh Thuận": Province(11.6739, 108.8629, "Central"),
+    "Bình Thuận": Province(10.9336, 108.1001, "Central"),
+    "Kon Tum": Province(14.3539, 108.0095, "Central"),
+    "Gia Lai": Province(13.9808, 108.2218, "Central"),
+    "Đắk Lắk": Province(12.6704, 108.0372, "Central"),
+    "Đắk Nông": Province(12.0040, 107.6874, "Central"),
+    "Lâm Đồng": Province(11.9404, 108.4583, "Central"),
+    
+    # Southern Vietnam
+    "Hồ Chí Minh": Province(10.8231, 106.6297, "South"),
+    "Cần Thơ": Province(10.0452, 105.7469, "South"),
+    "Biên Hòa": Province(10.9513, 106.8226, "South"),
+    "Vũng Tàu": Province(10.3460, 107.0843, "South"),
+    "Long Xuyên": Province(10.3864, 105.4351, "South"),
+    "Tây Ninh": Province(11.3598, 106.1108, "South"),
+    "Bình Phước": Province(11.7512, 106.7235, "South"),
+    "Bình Dương": Province(11.3254, 106.4772, "South"),
+    "Đồng Nai": Province(10.9513, 106.8226, "South"),
+    "Bà Rịa - Vũng Tàu": Province(10.3460, 107.0843, "South"),
+    "Long An": Province(10.5446, 106.4121, "South"),
+    "Tiền Giang": Province(10.3639, 106.3638, "South"),
+    "Bến Tre": Province(10.2433, 106.3759, "South"),
+    "Trà Vinh": Province(9.9513, 106.3346, "South"),
+    "Vĩnh Long": Province(10.2538, 105.9722, "South"),
+    "Đồng Tháp": Province(10.4937, 105.6882, "South"),
+    "An Giang": Province(10.3864, 105.4351, "South"),
+    "Kiên Giang": Province(10.0187, 105.1629, "South"),
+    "Hậu Giang": Province(9.7579, 105.6404, "South"),
+    "Sóc Trăng": Province(9.6037, 105.9736, "South"),
+    "Bạc Liêu": Province(9.2929, 105.7275, "South"),
+    "Cà Mau": Province(9.1769, 105.1521, "South")
+}
+
+# Lowercased province name -> canonical name, and a single pattern over all of them.
+# Longer names come first in the alternation so "Thừa Thiên Huế" wins over "Huế";
+# the lookahead reports the longest province starting at every position in one pass.
+PROVINCE_LOOKUP = {province.lower(): province for province in VIETNAM_PROVINCES}
+PROVINCE_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(name) for name in sorted(PROVINCE_LOOKUP, key=len, reverse=True)) + "))"
+)
+
+# The province table as a frame so coordinates and regions can be joined onto many rows at once,
+# and a categorical dtype so province groupings work on integer codes
+PROVINCE_FRAME = pd.DataFrame.from_dict(
+    VIETNAM_PROVINCES, orient='index', columns=['Latitude', 'Longitude', 'Region']
+)
+PROVINCE_DTYPE = pd.CategoricalDtype(list(VIETNAM_PROVINCES))
+
+
+@functools.lru_cache(maxsize=4096)
+def extract_provinces(location_str):
     """
-    Create an interactive province-level map visualization of Vietnam
-    that shows job distribution across all provinces and major cities
+    Extract all provinces from a location string, longest names first.
+    Matches nested inside a longer province name are discarded.
+    Results are memoized per location string and returned as a tuple.
     """
+    text = location_str.lower()
+    matches = [(match.start(), match.group(1)) for match in PROVINCE_PATTERN.finditer(text)]
     
-    # Define Vietnam provinces with coordinates
-    vietnam_provinces = {
-        # Northern Vietnam
-        "Hà Nội": [21.0285, 105.8542],
-        "Hải Phòng": [20.8449, 106.6881],
-        "Thái Nguyên": [21.5942, 105.8480],
-        "Bắc Ninh": [21.1861, 106.0763],
-        "Hạ Long": [20.9515, 107.0748],
-        "Lào Cai": [22.4855, 103.9757],
-        "Điện Biên": [21.3856, 103.0321],
-        "Hải Dương": [20.9373, 106.3145],
-        "Nam Định": [20.4345, 106.1680],
-        "Ninh Bình": [20.2478, 105.9743],
-        "Vĩnh Phúc": [21.3608, 105.5474],
-        "Cao Bằng": [22.6666, 106.2639],
-        "Lạng Sơn": [21.8531, 106.7608],
-        "Bắc Giang": [21.2717, 106.1947],
-        "Thái Bình": [20.4462, 106.3366],
-        "Hà Giang": [22.8025, 104.9784],
-        "Yên Bái": [21.7226, 104.9096],
-        "Phú Thọ": [21.4219, 105.2245],
-        "Tuyên Quang": [21.7767, 105.2280],
-        "Hà Nam": [20.5835, 105.9241],
-        "Bắc Kạn": [22.1477, 105.8347],
-        "Hưng Yên": [20.6546, 106.0569],
-        "Hòa Bình": [20.8172, 105.3380],
-        "Quảng Ninh": [21.0064, 107.2925],
-        "Sơn La": [21.1018, 103.7289],
-        
-        # Central Vietnam
-        "Đà Nẵng": [16.0544, 108.2022],
-        "Huế": [16.4637, 107.5909],
-        "Nha Trang": [12.2388, 109.1968],
-        "Quy Nhơn": [13.7829, 109.2196],
-        "Đà Lạt": [11.9404, 108.4583],
-        "Thanh Hóa": [19.8068, 105.7852],
-        "Nghệ An": [19.2339, 104.9200],
-        "Hà Tĩnh": [18.3559, 105.8877],
-        "Quảng Bình": [17.4682, 106.6004],
-        "Quảng Trị": [16.7943, 107.0451],
-        "Thừa Thiên Huế": [16.4637, 107.5909],
-        "Quảng Nam": [15.5394, 108.0191],
-        "Quảng Ngãi": [15.1213, 108.7953],
-        "Bình Định": [13.7829, 109.2196],
-        "Phú Yên": [13.0881, 109.0928],
-        "Khánh Hòa": [12.2388, 109.1968],
-        "Ninh Thuận": [11.6739, 108.8629],
-        "Bình Thuận": [10.9336, 108.1001],
-        "Kon Tum": [14.3539, 108.0095],
-        "Gia Lai": [13.9808, 108.2218],
-        "Đắk Lắk": [12.6704, 108.0372],
-        "Đắk Nông": [12.0040, 107.6874],
-        "Lâm Đồng": [11.9404, 108.4583],
-        
-        # Southern Vietnam
-        "Hồ Chí Minh": [10.8231, 106.6297],
-        "Cần Thơ": [10.0452, 105.7469],
-        "Biên Hòa": [10.9513, 106.8226],
-        "Vũng Tàu": [10.3460, 107.0843],
-        "Long Xuyên": [10.3864, 105.4351],
-        "Tây Ninh": [11.3598, 106.1108],
-        "Bình Phước": [11.7512, 106.7235],
-        "Bình Dương": [11.3254, 106.4772],
-        "Đồng Nai": [10.9513, 106.8226],
-        "Bà Rịa - Vũng Tàu": [10.3460, 107.0843],
-        "Long An": [10.5446, 106.4121],
-        "Tiền Giang": [10.3639, 106.3638],
-        "Bến Tre": [10.2433, 106.3759],
-        "Trà Vinh": [9.9513, 106.3346],
-        "Vĩnh Long": [10.2538, 105.9722],
-        "Đồng Tháp": [10.4937, 105.6882],
-        "An Giang": [10.3864, 105.4351],
-        "Kiên Giang": [10.0187, 105.1629],
-        "Cần Thơ": [10.0452, 105.7469],
-        "Hậu Giang": [9.7579, 105.6404],
-        "Sóc Trăng": [9.6037, 105.9736],
-        "Bạc Liêu": [9.2929, 105.7275],
-        "Cà Mau": [9.1769, 105.1521]
-    }
-    
-    # Define regions for color coding
-    province_regions = {
-        # Northern provinces
-        "Hà Nội": "North",
-        "Hải Phòng": "North",
-        "Thái Nguyên": "North",
-        "Bắc Ninh": "North",
-        "Hạ Long": "North",
-        "Lào Cai": "North",
-        "Điện Biên": "North",
-        "Hải Dương": "North",
-        "Nam Định": "North",
-        "Ninh Bình": "North",
-        "Vĩnh Phúc": "North",
-        "Cao Bằng": "North",
-        "Lạng Sơn": "North",
-        "Bắc Giang": "North",
-        "Thái Bình": "North",
-        "Hà Giang": "North",
-        "Yên Bái": "North",
-        "Phú Thọ": "North",
-        "Tuyên Quang": "North",
-        "Hà Nam": "North",
-        "Bắc Kạn": "North",
-        "Hưng Yên": "North",
-        "Hòa Bình": "North",
-        "Quảng Ninh": "North",
-        "Sơn La": "North",
-        
-        # Central provinces
-        "Đà Nẵng": "Central",
-        "Huế": "Central",
-        "Nha Trang": "Central",
-        "Quy Nhơn": "Central",
-        "Đà Lạt": "Central",
-        "Thanh Hóa": "Central",
-        "Nghệ An": "Central",
-        "Hà Tĩnh": "Central",
-        "Quảng Bình": "Central",
-        "Quảng Trị": "Central",
-        "Thừa Thiên Huế": "Central",
-        "Quảng Nam": "Central",
-        "Quảng Ngãi": "Central",
-        "Bình Định": "Central",
-        "Phú Yên": "Central",
-        "Khánh Hòa": "Central",
-        "Ninh Thuận": "Central",
-        "Bình Thuận": "Central",
-        "Kon Tum": "Central",
-        "Gia Lai": "Central",
-        "Đắk Lắk": "Central",
-        "Đắk Nông": "Central",
-        "Lâm Đồng": "Central",
-        
-        # Southern provinces
-        "Hồ Chí Minh": "South",
-        "Cần Thơ": "South",
-        "Biên Hòa": "South",
-        "Vũng Tàu": "South",
-        "Long Xuyên": "South",
-        "Tây Ninh": "South",
-        "Bình Phước": "South",
-        "Bình Dương": "South",
-        "Đồng Nai": "South",
-        "Bà Rịa - Vũng Tàu": "South",
-        "Long An": "South",
-        "Tiền Giang": "South",
-        "Bến Tre": "South",
-        "Trà Vinh": "South",
-        "Vĩnh Long": "South",
-        "Đồng Tháp": "South",
-        "An Giang": "South",
-        "Kiên Giang": "South",
-        "Hậu Giang": "South",
-        "Sóc Trăng": "South",
-        "Bạc Liêu": "South",
-        "Cà Mau": "South"
-    }
-    
-    # Extract location counts
-    location_counts = filtered_jobs['Location'].value_counts().reset_index()
-    location_counts.columns = ['Location', 'Jobs']
+    # Most locations name a single province, so skip overlap resolution entirely
+    if len(matches) == 1:
+        return (PROVINCE_LOOKUP[matches[0][1]],)
     
-    # Process job data by location
-    location_data = []
+    matches.sort(key=lambda match: len(match[1]), reverse=True)
     
-    # Function to extract all provinces from a location string
-    def extract_provinces(location_str):
-        found_provinces = []
+    found_provinces = []
+    claimed_spans = []
+    for start, name in matches:
+        end = start + len(name)
+        # Skip matches overlapping a longer province that was already claimed
+        if any(start < claimed_end and claimed_start < end for claimed_start, claimed_end in claimed_spans):
+            continue
+        claimed_spans.append((start, end))
         
-        # Sort provinces by length (descending) to match longer names first 
-        # (prevents partial matches like matching "Hà" in "Hà Nội")
-        sorted_provinces = sorted(vietnam_provinces.keys(), key=len, reverse=True)
-        
-        # Clone the location string for processing
-        remaining_text = location_str.lower()
-        
-        # Try to find all provinces in the location string
-        for province in sorted_provinces:
-            if province.lower() in remaining_text:
-                found_provinces.append(province)
-                # Remove the matched province from the string to prevent double counting
-                remaining_text = remaining_text.replace(province.lower(), "")
-        
-        return found_provinces
+        province = PROVINCE_LOOKUP[name]
+        if province not in found_provinces:
+            found_provinces.append(province)
     
-    # Process each location
-    for idx, row in location_counts.iterrows():
-        location = row['Location']
-        jobs = row['Jobs']
-        
-        # Extract all provinces from the location string
-        provinces = extract_provinces(location)
-        
-        # If multiple provinces found, add the full job count to each province
-        if len(provinces) > 1:
-            for province in provinces:
-                coords = vietnam_provinces[province]
-                region = province_regions[province]
-                
-                # Add small random offset to avoid overlapping points in the same province
-                offset = 0.02
-                lat = coords[0] + random.uniform(-offset, offset)
-                lon = coords[1] + random.uniform(-offset, offset)
-                
-                location_data.append({
-                    'Location': location,
-                    'Province': province,
-                    'Region': region,
-                    'Jobs': jobs,  # Full job count for each province
-                    'Latitude': lat,
-                    'Longitude': lon
-                })
-        else:
-            # Single province found
-            province = provinces[0]
-            coords = vietnam_provinces[province]
-            region = province_regions[province]
-            
-            # Add small random offset to avoid overlapping points in the same province
-            offset = 0.02
-            lat = coords[0] + random.uniform(-offset, offset)
-            lon = coords[1] + random.uniform(-offset, offset)
-            
-            location_data.append({
-                'Location': location,
-                'Province': province,
-                'Region': region,
-                'Jobs': jobs,
-                'Latitude': lat,
-                'Longitude': lon
-            })
+    return tuple(found_provinces)
+
+
+def expand_location_provinces(location_counts_items):
+    """
+    Expand (location, job count) pairs into one row per province, with coordinates and region
+    """
+    df_locations = pd.DataFrame(list(location_counts_items), columns=['Location', 'Jobs'])
+    
+    # Every province found in a location gets that location's full job count
+    df_locations['Province'] = [extract_provinces(location) for location in df_locations['Location']]
+    df_locations = df_locations.explode('Province', ignore_index=True).dropna(subset=['Province'])
     
+    return df_locations.join(PROVINCE_FRAME, on='Province')
+
+
+@st.cache_data(show_spinner=False)
+def _build_province_dataframe(location_counts_items):
+    """
+    Expand (location, job count) pairs into one row per province with jittered map coordinates
+    """
     # Create DataFrame for locations
-    df_locations = pd.DataFrame(location_data)
+    df_locations = expand_location_provinces(location_counts_items)
     
-    # Calculate province job totals
-    province_job_totals = df_locations.groupby('Province')['Jobs'].sum().reset_index()
-    province_job_totals = province_job_totals.sort_values('Jobs', ascending=False)
+    # Add small seeded offsets in one call to avoid overlapping points in the same province
+    if not df_locations.empty:
+        rng = np.random.default_rng(0)
+        jitter = rng.uniform(-0.02, 0.02, size=(len(df_locations), 2))
+        df_locations[['Latitude', 'Longitude']] = df_locations[['Latitude', 'Longitude']].to_numpy() + jitter
     
+    return df_locations
+
+
+@st.cache_data(show_spinner=False)
+def _build_map_figure(df_locations):
+    """
+    Build the province bubble map figure from the per-province location rows
+    """
     # Create the map figure
     fig = go.Figure()
     
@@ -920,36 +710,33 @@ def create_vietnam_province_map(filtered_jobs):
     # Ensure minimum bubble size is visible but max size doesn't overwhelm the map
     min_size, max_size = 10, 40
     
-    # Function to scale marker size using square root scaling for better visual representation
-    def scale_marker_size(jobs):
-        if max_jobs == min_jobs:  # Prevent division by zero
-            return (min_size + max_size) / 2
-        else:
-            # Square root scaling provides a more balanced visual representation
-            scale_factor = (jobs / max_jobs) ** 0.5  # Square root scaling
-            return min_size + scale_factor * (max_size - min_size)
+    # Scale all marker sizes at once using square root scaling for better visual representation
+    if max_jobs == min_jobs:  # Prevent division by zero
+        marker_sizes = pd.Series((min_size + max_size) / 2, index=df_locations.index)
+    else:
+        marker_sizes = min_size + np.sqrt(df_locations['Jobs'] / max_jobs) * (max_size - min_size)
+    
+    # Hover text for every province at once
+    hover_text = (
+        df_locations['Province'] + " (" + df_locations['Location'].astype(str) + "): "
+        + df_locations['Jobs'].astype(str) + " jobs"
+    )
     
-    # Add province markers with job counts by region
+    # Add one trace per region so its legend entry shows and hides that region's markers
     for region in ["North", "Central", "South"]:
-        # Filter locations for this region
-        region_df = df_locations[df_locations['Region'] == region]
-        
-        if not region_df.empty:
-            # Calculate scaled sizes for each marker
-            sizes = region_df['Jobs'].apply(scale_marker_size)
-            
-            # Add markers for each province with job data
-            fig.add_trace(go.Scattermapbox(
-                lat=region_df['Latitude'],
-                lon=region_df['Longitude'],
+        region_mask = df_locations['Region'] == region
+        if region_mask.any():
+            fig.add_trace(go.Scattermap(
+                lat=df_locations.loc[region_mask, 'Latitude'],
+                lon=df_locations.loc[region_mask, 'Longitude'],
                 mode='markers',
                 marker=dict(
-                    size=sizes,
+                    size=marker_sizes[region_mask].to_numpy(),
                     color=region_colors[region],
                     opacity=0.8,
                     sizemode='diameter'
                 ),
-                text=region_df.apply(lambda x: f"{x['Province']} ({x['Location']}): {round(x['Jobs'])} jobs", axis=1),
+                text=hover_text[region_mask],
                 name=f"{region} Provinces",
                 hoverinfo='text'
             ))
@@ -959,7 +746,7 @@ def create_vietnam_province_map(filtered_jobs):
         autosize=True,
         hovermode='closest',
         height=700,
-        mapbox=dict(
+        map=dict(
             style="carto-positron",
             zoom=5,
             center=dict(lat=16.0, lon=107.0)  # Center of Vietnam
@@ -977,22 +764,22 @@ def create_vietnam_province_map(filtered_jobs):
     # Add region view buttons
     buttons = [
         dict(
-            args=[{"mapbox.center": {"lat": 21.0, "lon": 105.8}, "mapbox.zoom": 6}],
+            args=[{"map.center": {"lat": 21.0, "lon": 105.8}, "map.zoom": 6}],
             label="North Vietnam",
             method="relayout"
         ),
         dict(
-            args=[{"mapbox.center": {"lat": 16.0, "lon": 108.0}, "mapbox.zoom": 6}],
+            args=[{"map.center": {"lat": 16.0, "lon": 108.0}, "map.zoom": 6}],
             label="Central Vietnam",
             method="relayout"
         ),
         dict(
-            args=[{"mapbox.center": {"lat": 10.8, "lon": 106.6}, "mapbox.zoom": 6}],
+            args=[{"map.center": {"lat": 10.8, "lon": 106.6}, "map.zoom": 6}],
             label="South Vietnam",
             method="relayout"
         ),
         dict(
-            args=[{"mapbox.center": {"lat": 16.0, "lon": 107.0}, "mapbox.zoom": 5}],
+            args=[{"map.center": {"lat": 16.0, "lon": 107.0}, "map.zoom": 5}],
             label="Full Vietnam",
             method="relayout"
         )
@@ -1015,158 +802,49 @@ def create_vietnam_province_map(filtered_jobs):
     return fig
 
 
-def display_province_job_statistics(filtered_jobs):
+def create_vietnam_province_map(filtered_jobs):
     """
-    Display detailed province job statistics with tables and charts
-    using improved province extraction logic
+    Create an interactive province-level map visualization of Vietnam
+    that shows job distribution across all provinces and major cities
     """
+    # Pass location counts as hashable pairs so reruns with unchanged data hit the cache;
+    # unused categories are dropped so provinces are only extracted for locations with jobs
+    location_counts = filtered_jobs['Location'].value_counts()
+    location_counts = location_counts[location_counts > 0]
+    df_locations = _build_province_dataframe(tuple(location_counts.items()))
     
-    # Define Vietnam provinces with their regions
-    vietnam_regions = {
-        # Northern provinces
-        "Hà Nội": "North",
-        "Hải Phòng": "North",
-        "Thái Nguyên": "North",
-        "Bắc Ninh": "North",
-        "Hạ Long": "North",
-        "Lào Cai": "North",
-        "Điện Biên": "North",
-        "Hải Dương": "North",
-        "Nam Định": "North",
-        "Ninh Bình": "North",
-        "Vĩnh Phúc": "North",
-        "Cao Bằng": "North",
-        "Lạng Sơn": "North",
-        "Bắc Giang": "North",
-        "Thái Bình": "North",
-        "Hà Giang": "North",
-        "Yên Bái": "North",
-        "Phú Thọ": "North",
-        "Tuyên Quang": "North",
-        "Hà Nam": "North",
-        "Bắc Kạn": "North",
-        "Hưng Yên": "North",
-        "Hòa Bình": "North",
-        "Quảng Ninh": "North",
-        "Sơn La": "North",
-        
-        # Central provinces
-        "Đà Nẵng": "Central",
-        "Huế": "Central",
-        "Nha Trang": "Central",
-        "Quy Nhơn": "Central",
-        "Đà Lạt": "Central",
-        "Thanh Hóa": "Central",
-        "Nghệ An": "Central",
-        "Hà Tĩnh": "Central",
-        "Quảng Bình": "Central",
-        "Quảng Trị": "Central",
-        "Thừa Thiên Huế": "Central",
-        "Quảng Nam": "Central",
-        "Quảng Ngãi": "Central",
-        "Bình Định": "Central",
-        "Phú Yên": "Central",
-        "Khánh Hòa": "Central",
-        "Ninh Thuận": "Central",
-        "Bình Thuận": "Central",
-        "Kon Tum": "Central",
-        "Gia Lai": "Central",
-        "Đắk Lắk": "Central",
-        "Đắk Nông": "Central",
-        "Lâm Đồng": "Central",
-        
-        # Southern provinces
-        "Hồ Chí Minh": "South",
-        "Cần Thơ": "South",
-        "Biên Hòa": "South",
-        "Vũng Tàu": "South",
-        "Long Xuyên": "South",
-        "Tây Ninh": "South",
-        "Bình Phước": "South",
-        "Bình Dương": "South",
-        "Đồng Nai": "South",
-        "Bà Rịa - Vũng Tàu": "South",
-        "Long An": "South",
-        "Tiền Giang": "South",
-        "Bến Tre": "South",
-        "Trà Vinh": "South",
-        "Vĩnh Long": "South",
-        "Đồng Tháp": "South",
-        "An Giang": "South",
-        "Kiên Giang": "South",
-        "Hậu Giang": "South",
-        "Sóc Trăng": "South",
-        "Bạc Liêu": "South",
-        "Cà Mau": "South"
-    }
-    
-    # Extract location counts
-    location_counts = filtered_jobs['Location'].value_counts().reset_index()
-    location_counts.columns = ['Location', 'Jobs']
-    
-    # Function to extract all provinces from a location string
-    def extract_provinces(location_str):
-        found_provinces = []
-        
-        # Sort provinces by length (descending) to match longer names first
-        # (prevents partial matches like matching "Hà" in "Hà Nội")
-        sorted_provinces = sorted(vietnam_regions.keys(), key=len, reverse=True)
-        
-        # Clone the location string for processing
-        remaining_text = location_str.lower()
-        
-        # Try to find all provinces in the location string
-        for province in sorted_provinces:
-            if province.lower() in remaining_text:
-                found_provinces.append(province)
-                # Remove the matched province from the string to prevent double counting
-                remaining_text = remaining_text.replace(province.lower(), "")
-        
-        return found_provinces
-    
-    # Process job data by location
-    location_data = []
-    
-    # Process each location
-    for idx, row in location_counts.iterrows():
-        location = row['Location']
-        jobs = row['Jobs']
-        
-        # Extract all provinces from the location string
-        provinces = extract_provinces(location)
-        
-        # If multiple provinces found, add the full job count to each province
-        if len(provinces) > 1:
-            for province in provinces:
-                region = vietnam_regions[province]
-                
-                location_data.append({
-                    'Location': location,
-                    'Province': province,
-                    'Region': region,
-                    'Jobs': jobs  # Full job count for each province
-                })
-        else:
-            # Single province found
-            province = provinces[0]
-            region = vietnam_regions[province]
-            
-            location_data.append({
-                'Location': location,
-                'Province': province,
-                'Region': region,
-                'Jobs': jobs
-            })
-    
-    # Create DataFrame for locations
-    df_locations = pd.DataFrame(location_data)
-    
-    # Calculate province job totals and region totals
-    province_job_totals = df_locations.groupby('Province')['Jobs'].sum().reset_index()
-    province_job_totals = province_job_totals.sort_values('Jobs', ascending=False)
+    return _build_map_figure(df_locations)
+
+
+@st.cache_data(show_spinner=False)
+def _build_province_statistics(location_counts_items):
+    """
+    Expand (location, job count) pairs into provinces and total the jobs per province and region
+    """
+    # Create DataFrame for locations, one row per province
+    df_locations = expand_location_provinces(location_counts_items)
+    
+    # Calculate province job totals in one pass, grouping provinces by categorical code;
+    # each province belongs to exactly one region, so Region rides along with 'first'
+    df_locations['Province'] = df_locations['Province'].astype(PROVINCE_DTYPE)
+    province_job_totals = (
+        df_locations.groupby('Province', observed=True, sort=False)
+        .agg(Jobs=('Jobs', 'sum'), Region=('Region', 'first'))
+        .sort_values('Jobs', ascending=False)
+        .reset_index()
+    )
     
-    region_job_totals = df_locations.groupby('Region')['Jobs'].sum().reset_index()
+    # Region totals come from the small per-province frame instead of another full pass
+    region_job_totals = province_job_totals.groupby('Region')['Jobs'].sum().reset_index()
     
+    return df_locations, province_job_totals, region_job_totals
+
+
+@st.cache_data(show_spinner=False)
+def _build_province_figures(province_job_totals, region_job_totals):
+    """
+    Build the region pie chart and the province bar chart from the province statistics
+    """
     # Create region color map for consistent colors
     region_colors = {
         "North": "#8df5f2",
@@ -1174,75 +852,76 @@ def display_province_job_statistics(filtered_jobs):
         "South": "#9c7fca"
     }
     
-    # Display statistics in tabs
-    #tab1, tab2= st.tabs(["Regional Overview", "Province Breakdown"])
-    
-    #with tab1:
-        # Regional pie chart
+    # Regional pie chart
     region_fig = px.pie(
-            region_job_totals,
-            values='Jobs',
-            names='Region',
-            title='Job Distribution by Region',
-            color='Region',
-            color_discrete_map=region_colors,
-        )
-        
+        region_job_totals,
+        values='Jobs',
+        names='Region',
+        title='Job Distribution by Region',
+        color='Region',
+        color_discrete_map=region_colors,
+    )
+    
     region_fig.update_layout(
-            height=400,
-            legend_title="Region",
-            font=dict(size=12)
-        )
-        
+        height=400,
+        legend_title="Region",
+        font=dict(size=12)
+    )
+    
     region_fig.update_traces(
-            textinfo='percent+label+value',
-            hoverinfo='label+percent+value'
-        )
-        
-    st.plotly_chart(region_fig, use_container_width=True)
+        textinfo='percent+label+value',
+        hoverinfo='label+percent+value'
+    )
     
-    #with tab2:
-    # Top provinces bar chart
-    top_provinces = province_job_totals
-    # Round the job counts for display
-    top_provinces['Jobs'] = top_provinces['Jobs'].round().astype(int)
-        
-    # Merge with region information
-    province_region_map = df_locations[['Province', 'Region']].drop_duplicates()
-    top_provinces = pd.merge(top_provinces, province_region_map, on='Province')
-        
+    # Province bar chart; Region is already carried by the province totals
     province_fig = px.bar(
-            top_provinces,
-            x='Province',
-            y='Jobs',
-            color='Region',
-            title='Job By Provinces',
-            color_discrete_map=region_colors,
-            text='Jobs'
-        )
-        
+        province_job_totals,
+        x='Province',
+        y='Jobs',
+        color='Region',
+        title='Job By Provinces',
+        color_discrete_map=region_colors,
+        text='Jobs'
+    )
+    
     province_fig.update_layout(
-            height=500,
-            xaxis_title="Province",
-            yaxis_title="Number of Jobs",
-            xaxis={'categoryorder':'total descending'},
-            font=dict(size=12)
-        )
-        
+        height=500,
+        xaxis_title="Province",
+        yaxis_title="Number of Jobs",
+        xaxis={'categoryorder':'total descending'},
+        font=dict(size=12)
+    )
+    
     province_fig.update_traces(
-            texttemplate='%{y}',
-            textposition='outside',
-            hovertemplate='<b>%{x}</b><br>Jobs: %{y}<extra></extra>'
-        )
-        
+        texttemplate='%{y}',
+        textposition='outside',
+        hovertemplate='<b>%{x}</b><br>Jobs: %{y}<extra></extra>'
+    )
+    
+    return region_fig, province_fig
+
+
+def display_province_job_statistics(filtered_jobs):
+    """
+    Display detailed province job statistics with tables and charts
+    using improved province extraction logic
+    """
+    
+    # Pass location counts as hashable pairs so reruns with unchanged data hit the cache
+    location_counts = filtered_jobs['Location'].value_counts()
+    location_counts = location_counts[location_counts > 0]
+    df_locations, province_job_totals, region_job_totals = _build_province_statistics(
+        tuple(location_counts.items())
+    )
+    region_fig, province_fig = _build_province_figures(province_job_totals, region_job_totals)
+    
+    st.plotly_chart(region_fig, use_container_width=True)
     st.plotly_chart(province_fig, use_container_width=True)
         
     # Show province table
     st.subheader("All Provinces with Job Listings")
-    # Round the job counts for display in the table
-    display_province_totals = province_job_totals.copy()
-    display_province_totals['Jobs'] = display_province_totals['Jobs'].round().astype(int)
-    st.dataframe(display_province_totals)
+    # Job totals are summed value counts, so they are already whole numbers
+    st.dataframe(province_job_totals[['Province', 'Jobs']])
     
     return df_locations
 
@@ -1259,7 +938,7 @@ def display_regional_job_analysis(filtered_jobs):
     # Create and display the interactive province map
     try:
         map_fig = create_vietnam_province_map(filtered_jobs)
-        st.plotly_chart(map_fig, use_container_width=True, config={'displayModeBar': True})
+        show_chart(map_fig)
         
     except Exception as e:
         st.error(f"Could not create provincial visualization: {e}")
@@ -1278,105 +957,16 @@ def overview_page(filtered_jobs, all_jobs, analyst_jobs):
         """)
     st.markdown("<br>", unsafe_allow_html=True)
     # Key metrics
-    col1, col2, col3, col4, col5 = st.columns(5)
-        
-    # Metric 1: Total Jobs
-    with col1:
-        st.markdown(f"""
-        <div class='metric-container container-1'>
-            <div class='metric-content'>
-                <div class='metric-title'>Total Jobs</div>
-                <div class='metric-value-container'>
-                    <div class='metric-icon'>
-                        <i class='fas fa-briefcase'></i>
-                    </div>
-                    <div class='metric-value'>{len(all_jobs):,}</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Metric 2: Data-Related Jobs
-    with col2:
-        st.markdown(f"""
-        <div class='metric-container container-2'>
-            <div class='metric-content'>
-                <div class='metric-title'>Data Jobs</div>
-                <div class='metric-value-container'>
-                    <div class='metric-icon'>
-                        <i class='fas fa-laptop-code'></i>
-                    </div>
-                    <div class='metric-value'>{len(filtered_jobs):,}</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Metric 3: Analyst-Related Jobs
-    with col3:
-        st.markdown(f"""
-        <div class='metric-container container-3'>
-            <div class='metric-content'>
-                <div class='metric-title'>Analyst Jobs</div>
-                <div class='metric-value-container'>
-                    <div class='metric-icon'>
-                        <i class='fas fa-chart-line'></i>
-                    </div>
-                    <div class='metric-value'>{len(analyst_jobs):,}</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Metric 4: Average Min Salary
-    with col4:
-        st.markdown(f"""
-        <div class='metric-container container-4'>
-            <div class='metric-content'>
-                <div class='metric-title'>Min Salary (VND)</div>
-                <div class='metric-value-container'>
-                    <div class='metric-icon'>
-                        <i class='fas fa-money-bill'></i>
-                    </div>
-                    <div class='metric-value'>{filtered_jobs['Min_Salary'].mean()/1e6:.1f}M</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-
-    # Metric 5: Average Max Salary
-    with col5:
-        st.markdown(f"""
-        <div class='metric-container container-5'>
-            <div class='metric-content'>
-                <div class='metric-title'>Max Salary (VND)</div>
-                <div class='metric-value-container'>
-                    <div class='metric-icon'>
-                        <i class='fas fa-coins'></i>
-                    </div>
-                    <div class='metric-value'>{filtered_jobs['Max_Salary'].mean()/1e6:.1f}M</div>
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-            
-    # Load data
-    all_jobs_path = DATA_DIR / "processed_data.csv"
-    filtered_jobs_path = DATA_DIR / "filtered_data.csv"
-    analyst_jobs_path = DATA_DIR / "analyst_jobs.csv"
-    
-    all_jobs = load_data(all_jobs_path)
-    filtered_jobs = load_data(filtered_jobs_path)
-    analyst_jobs = load_data(analyst_jobs_path)
-    
-    if analyst_jobs is not None:
-        analyst_jobs = convert_string_to_list(analyst_jobs, ['Soft Skills', 'Hard Skills', 'Domains'])
-    
-    # Check if data is loaded successfully
-    if filtered_jobs is None:
-        st.error("Could not load the filtered jobs data. Please check the data files.")
-        return
-    
+    metrics = [
+        (":material/work: Total Jobs", f"{len(all_jobs):,}"),
+        (":material/computer: Data Jobs", f"{len(filtered_jobs):,}"),
+        (":material/monitoring: Analyst Jobs", f"{len(analyst_jobs):,}"),
+        (":material/payments: Min Salary (VND)", f"{filtered_jobs['Min_Salary'].mean()/1e6:.1f}M"),
+        (":material/savings: Max Salary (VND)", f"{filtered_jobs['Max_Salary'].mean()/1e6:.1f}M"),
+    ]
+    for col, (label, value) in zip(st.columns(5), metrics):
+        col.metric(label, value, border=True)
+
     st.markdown("<br><br>", unsafe_allow_html=True)
     
     # Create a layout with left for about section and right for cards
@@ -1494,33 +1084,36 @@ def job_distribution_page(filtered_jobs):
         
         with tab1:
             try:
-                filtered_jobs['Date'] = pd.to_datetime(filtered_jobs['Date'], errors='coerce')
-                # Remove any NaT values that might cause issues
-                date_df = filtered_jobs.dropna(subset=['Date'])
+                # Remove any NaT values that might cause issues (Date is parsed in load_data)
+                dates = filtered_jobs['Date'].dropna()
                 # Group by date for the time series
-                jobs_by_date = date_df.groupby(date_df['Date'].dt.date).size().reset_index(name='JobCount')
-                # Group by day of week for the column chart
-                date_df['Day'] = date_df['Date'].dt.strftime('%A')  # Get day name
-                jobs_by_day = date_df.groupby('Day').size().reset_index(name='JobCount')
+                jobs_by_date = dates.dt.normalize().value_counts().sort_index().rename_axis('Date').reset_index(name='JobCount')
+                # Count by day of week for the column chart; weekday numbers map straight to ordered day codes
+                day_counts = dates.dt.dayofweek.value_counts().sort_index()
+                jobs_by_day = pd.DataFrame({
+                    'Day': pd.Categorical.from_codes(day_counts.index, dtype=DAY_DTYPE),
+                    'JobCount': day_counts.to_numpy()
+                })
 
                 # Generate and display the time series and day by day column chart
                 if not jobs_by_date.empty:
                     time_series_fig = plot_job_postings_over_time(jobs_by_date)
-                    st.plotly_chart(time_series_fig, use_container_width=True, config={'displayModeBar': True})
+                    show_chart(time_series_fig)
                     st.markdown(f"""- The data shows **{jobs_by_date['JobCount'].max() if not jobs_by_date.empty else 'N/A'}** postings on the busiest day.""")
     
                     # Add a small space between charts
                     st.markdown("<br>", unsafe_allow_html=True)
 
                 if not jobs_by_day.empty:
-                    max_day_count = jobs_by_day['JobCount'].max()
-                    max_day = jobs_by_day.loc[jobs_by_day['JobCount'] == max_day_count, 'Day'].iloc[0]
-                    min_day_count = jobs_by_day['JobCount'].min()
-                    min_day = jobs_by_day.loc[jobs_by_day['JobCount'] == min_day_count, 'Day'].iloc[0]
+                    # Rank days busiest first; tied days are taken in alphabetical order
+                    day_ranking = sort_counts(pd.Series(jobs_by_day['JobCount'].to_numpy(), index=jobs_by_day['Day'].astype(str)))
+                    max_day, max_day_count = day_ranking.index[0], day_ranking.iloc[0]
+                    min_day_count = day_ranking.iloc[-1]
+                    min_day = day_ranking.index[day_ranking.to_numpy() == min_day_count][0]
                     
                     # Generate and display the day of week column chart
                     day_chart_fig = plot_job_postings_by_day(jobs_by_day)
-                    st.plotly_chart(day_chart_fig, use_container_width=True, config={'displayModeBar': True})
+                    show_chart(day_chart_fig, static=True)
 
                     # Display insights
                     st.markdown(f"""
@@ -1538,10 +1131,10 @@ def job_distribution_page(filtered_jobs):
         with tab3:
             # Create and display the job titles chart
             try:
-                job_title_counts = filtered_jobs['Job Title'].value_counts()
+                job_title_counts = sort_counts(filtered_jobs['Job Title'].value_counts())
                 if not job_title_counts.empty:
                     job_titles_fig = plot_top_job_titles(job_title_counts)
-                    st.plotly_chart(job_titles_fig, use_container_width=True, config={'displayModeBar': True})
+                    show_chart(job_titles_fig, static=True)
                     st.markdown(f"""
                     - **Most Common Job Title**: "{job_title_counts.index[0]}" is the most common job title with {job_title_counts.values[0]} listings
                     """)
@@ -1557,13 +1150,13 @@ def job_distribution_page(filtered_jobs):
 
                 if not job_counts.empty:
                     job_levels_fig = plot_jobs_level(job_counts)
-                    st.plotly_chart(job_levels_fig, use_container_width=True, config={'displayModeBar': True})
+                    show_chart(job_levels_fig)
                     st.markdown(f"""
                     - **Most Demanded Level**: {job_counts.index[0]} level leads with {job_counts.values[0]} openings ({(job_counts.values[0]/job_counts.sum()*100):.1f}% of listings)
                     """)
                 if not job_type_counts.empty:
                     job_types_fig = plot_jobs_type(job_type_counts)
-                    st.plotly_chart(job_types_fig, use_container_width=True, config={'displayModeBar': True})
+                    show_chart(job_types_fig)
                     st.markdown(f"""
                     - **Predominant Job Type**: {job_type_counts.index[0]} represents {job_type_counts.values[0]} positions ({(job_type_counts.values[0]/job_type_counts.sum()*100):.1f}% of available roles)
                     """)
@@ -1577,14 +1170,98 @@ def job_distribution_page(filtered_jobs):
         st.info("Please check your data files and try refreshing the page.")
 
 # Updated Salary Analysis Page function
+@st.cache_data(show_spinner=False)
+def min_salary_order(min_salaries):
+    """
+    Return row positions sorted by minimum salary, and the sorted salaries, skipping missing values
+    """
+    values = min_salaries.to_numpy(dtype=float)
+    order = np.argsort(values, kind='stable')
+    order = order[:np.count_nonzero(~np.isnan(values))]
+    return order, values[order]
+
+
+@st.cache_data(show_spinner=False)
+def salary_summary(salary_jobs):
+    """
+    Return the min, max and mean of each salary and experience column in one pass, for the
+    slider bounds and insights
+    """
+    return salary_jobs[['Min_Salary', 'Max_Salary', 'exp_min', 'exp_max']].agg(['min', 'max', 'mean'])
+
+
+@st.cache_data(show_spinner=False)
+def _build_salary_heatmap(salary_jobs):
+    """
+    Build the average minimum salary heatmap (salaries in millions) over the top 5 locations,
+    or None without data
+    """
+    # Get top 5 locations by job count
+    top_locations = sort_counts(salary_jobs['Location'].value_counts()).head(5).index.tolist()
+    
+    # Filter to the top locations first so only their groups are aggregated
+    top_location_jobs = salary_jobs[salary_jobs['Location'].isin(top_locations)]
+    
+    if top_location_jobs.empty:
+        return None
+    
+    # Average salary (already in millions) per experience level and location in one pass,
+    # filling empty cells with 0 to avoid errors
+    heatmap_pivot = top_location_jobs.pivot_table(
+        index='exp_min', 
+        columns='Location', 
+        values='Min_Salary',
+        aggfunc='mean',
+        fill_value=0,
+        observed=True
+    )
+    
+    # Create heatmap with improved styling
+    fig_heatmap = px.imshow(
+        heatmap_pivot,
+        labels=dict(x="Location", y="Minimum Experience (Years)", color="Salary (M VND)"),
+        x=heatmap_pivot.columns,
+        y=heatmap_pivot.index,
+        color_continuous_scale=['#ffffff', '#a8e7fb', '#3391cb'],
+        aspect="auto",
+        text_auto='.1f'
+    )
+    
+    fig_heatmap.update_layout(
+        title="Average Minimum Salary (Million VND) by Location and Experience",
+        height=600,
+        template='plotly_white',
+        margin=dict(l=10, r=10, t=130, b=10),
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        xaxis=dict(
+            title="Location",
+            title_standoff=20,  # Adds spacing
+            side="top"  # Moves x-axis title to the top
+        ),
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Inter, sans-serif"
+        )
+    )
+    
+    fig_heatmap.update_traces(
+        hovertemplate='<b>%{x}</b><br>Experience: %{y} years<br>Salary: %{z:.1f}M VND<extra></extra>'
+    )
+    
+    return fig_heatmap
+
+
 def salary_analysis(filtered_jobs):
     """
     Display the Salary Analysis page with improved styling and interactivity
     """
     st.markdown('<div id="salary-analysis-section" class="section-header">Salary Analysis</div>', unsafe_allow_html=True)
     
-    min_salary = int(filtered_jobs['Min_Salary'].min() / 1e6)
-    max_salary = int(filtered_jobs['Max_Salary'].max() / 1e6 + 1)
+    stats = salary_summary(filtered_jobs)
+    min_salary = int(stats.at['min', 'Min_Salary'] / 1e6)
+    max_salary = int(stats.at['max', 'Max_Salary'] / 1e6 + 1)
     
     # Improved slider with better styling
     salary_range = st.slider(
@@ -1595,11 +1272,16 @@ def salary_analysis(filtered_jobs):
         step=1
     )
     
-    # Filter data based on salary range
-    filtered_by_salary = filtered_jobs[
-        (filtered_jobs['Min_Salary'] >= salary_range[0] * 1e6) & 
-        (filtered_jobs['Max_Salary'] <= salary_range[1] * 1e6)
-    ]
+    # Filter data based on salary range: binary-search the presorted minimum salaries,
+    # then check the maximum salary only for the rows above the lower bound
+    order, sorted_min = min_salary_order(filtered_jobs['Min_Salary'])
+    candidates = order[np.searchsorted(sorted_min, salary_range[0] * 1e6, side='left'):]
+    in_range = candidates[filtered_jobs['Max_Salary'].to_numpy()[candidates] <= salary_range[1] * 1e6]
+    filtered_by_salary = filtered_jobs.iloc[np.sort(in_range)]
+    
+    # Scale salaries to millions once for all the charts below
+    salary_millions = filtered_by_salary[['Location', 'exp_min', 'Min_Salary', 'Max_Salary']].copy()
+    salary_millions[['Min_Salary', 'Max_Salary']] /= 1e6
     
     st.markdown(
     f'<div style="text-align: right;">Showing {len(filtered_by_salary)} jobs within selected salary range</div>',
@@ -1612,8 +1294,8 @@ def salary_analysis(filtered_jobs):
     
     with tab1:
         try:
-            # Convert to millions for better readability
-            salary_data = filtered_by_salary[['Min_Salary', 'Max_Salary']] / 1e6
+            # Salaries are already in millions for better readability
+            salary_data = salary_millions[['Min_Salary', 'Max_Salary']]
             salary_data.columns = ['Min Salary (M VND)', 'Max Salary (M VND)']
             
             # Create two separate histograms with improved styling
@@ -1662,22 +1344,18 @@ def salary_analysis(filtered_jobs):
                 hovertemplate='<b>%{x:.1f}M VND</b><br>Jobs: %{y}<extra></extra>'
             )
             
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True})
+            show_chart(fig)
         except Exception as e:
             st.error(f"Error creating salary distribution chart: {e}")
             
     with tab2:
         try:
             # Calculate average salary by experience level
-            exp_salary = filtered_by_salary.groupby('exp_min').agg({
+            exp_salary = salary_millions.groupby('exp_min').agg({
                 'Min_Salary': 'mean',
                 'Max_Salary': 'mean'
             }).reset_index()
             
-            # Convert to millions
-            exp_salary['Min_Salary'] = exp_salary['Min_Salary'] / 1e6
-            exp_salary['Max_Salary'] = exp_salary['Max_Salary'] / 1e6
-            
             # Create line plot with Plotly and improved styling
             fig_exp = go.Figure()
             
@@ -1723,70 +1401,17 @@ def salary_analysis(filtered_jobs):
                 hovertemplate='<b>%{x} Years</b><br>Salary: %{y:.1f}M VND<extra></extra>'
             )
             
-            st.plotly_chart(fig_exp, use_container_width=True, config={'displayModeBar': True})
+            show_chart(fig_exp)
         except Exception as e:
             st.error(f"Error creating salary by experience chart: {e}")
     
     with tab3:
         try:
-            # Group by Location and exp_min, then get the mean salary
-            heatmap_data = filtered_by_salary.groupby(['Location', 'exp_min'])['Min_Salary'].mean().reset_index()
-            
-            # Convert to millions
-            heatmap_data['Min_Salary'] /= 1e6
-            
-            # Get top 5 locations by job count
-            top_locations = filtered_by_salary['Location'].value_counts().nlargest(5).index.tolist()
+            # Only the columns the heatmap needs are hashed for the cache key
+            fig_heatmap = _build_salary_heatmap(salary_millions[['Location', 'exp_min', 'Min_Salary']])
             
-            # Filter heatmap data for top locations
-            heatmap_data_filtered = heatmap_data[heatmap_data['Location'].isin(top_locations)]
-            
-            if not heatmap_data_filtered.empty:
-                # Pivot the data
-                heatmap_pivot = heatmap_data_filtered.pivot(
-                    index='exp_min', 
-                    columns='Location', 
-                    values='Min_Salary'
-                )
-                
-                # Replace NaN with 0 to avoid errors
-                heatmap_pivot = heatmap_pivot.fillna(0)
-                
-                # Create heatmap with improved styling
-                fig_heatmap = px.imshow(
-                    heatmap_pivot,
-                    labels=dict(x="Location", y="Minimum Experience (Years)", color="Salary (M VND)"),
-                    x=heatmap_pivot.columns,
-                    y=heatmap_pivot.index,
-                    color_continuous_scale=['#ffffff', '#a8e7fb', '#3391cb'],
-                    aspect="auto",
-                    text_auto='.1f'
-                )
-                
-                fig_heatmap.update_layout(
-                    title="Average Minimum Salary (Million VND) by Location and Experience",
-                    height=600,
-                    template='plotly_white',
-                    margin=dict(l=10, r=10, t=130, b=10),
-                    plot_bgcolor="white",
-                    paper_bgcolor="white",
-                    xaxis=dict(
-                        title="Location",
-                        title_standoff=20,  # Adds spacing
-                        side="top"  # Moves x-axis title to the top
-                    ),
-                    hoverlabel=dict(
-                        bgcolor="white",
-                        font_size=12,
-                        font_family="Inter, sans-serif"
-                    )
-                )
-                
-                fig_heatmap.update_traces(
-                    hovertemplate='<b>%{x}</b><br>Experience: %{y} years<br>Salary: %{z:.1f}M VND<extra></extra>'
-                )
-                
-                st.plotly_chart(fig_heatmap, use_container_width=True, config={'displayModeBar': True})
+            if fig_heatmap is not None:
+                show_chart(fig_heatmap)
             else:
                 st.info("Not enough data to create a salary heatmap by location and experience")
         except Exception as e:
@@ -1797,14 +1422,12 @@ def salary_analysis(filtered_jobs):
             
             try:
                 # Calculate average salary by location (simpler view)
-                loc_salary = filtered_by_salary.groupby('Location').agg({
+                loc_salary = salary_millions.groupby('Location', observed=True).agg({
                     'Min_Salary': 'mean',
                     'Max_Salary': 'mean'
                 }).reset_index()
                 
-                # Convert to millions and take top 5 locations
-                loc_salary['Min_Salary'] = loc_salary['Min_Salary'] / 1e6
-                loc_salary['Max_Salary'] = loc_salary['Max_Salary'] / 1e6
+                # Take top 5 locations
                 loc_salary = loc_salary.sort_values('Min_Salary', ascending=False).head(5)
                 
                 # Create bar chart with improved styling
@@ -1839,15 +1462,15 @@ def salary_analysis(filtered_jobs):
                     hovertemplate='<b>%{x}</b><br>%{data.name}: %{y:.1f}M VND<extra></extra>'
                 )
                 
-                st.plotly_chart(fig_loc, use_container_width=True, config={'displayModeBar': True})
+                show_chart(fig_loc)
             except Exception as e2:
                 st.error(f"Error creating alternative salary chart: {e2}")
     
     # Insights section
     st.markdown("### Key Insights on Salary")
     st.markdown(f"""
-    - **Average Salary Range**: The average job posting offers between {filtered_jobs['Min_Salary'].mean()/1e6:.1f}M and {filtered_jobs['Max_Salary'].mean()/1e6:.1f}M VND
-    - **Experience Impact**: Each additional year of experience correlates with approximately {(filtered_jobs['Max_Salary'].max()/1e6 - filtered_jobs['Min_Salary'].min()/1e6)/(filtered_jobs['exp_max'].max() - filtered_jobs['exp_min'].min()):.1f}M VND increase in salary
+    - **Average Salary Range**: The average job posting offers between {stats.at['mean', 'Min_Salary']/1e6:.1f}M and {stats.at['mean', 'Max_Salary']/1e6:.1f}M VND
+    - **Experience Impact**: Each additional year of experience correlates with approximately {(stats.at['max', 'Max_Salary']/1e6 - stats.at['min', 'Min_Salary']/1e6)/(stats.at['max', 'exp_max'] - stats.at['min', 'exp_min']):.1f}M VND increase in salary
     - **Location Impact**: Top locations offer salary premiums of up to 20-30% compared to the average
     """)
     st.markdown('</div>', unsafe_allow_html=True)
@@ -1887,7 +1510,7 @@ def skills_analysis_page(analyst_jobs):
         # Plot hard skills using Plotly with improved styling
         if not hard_skill_df.empty:
             fig = plotly_skills_chart(hard_skill_df, f"Top {n_skills} Hard Skills Required", "purple", n_skills)
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True})
+            show_chart(fig)
         else:
             st.info("No hard skills data available.")
         
@@ -1901,7 +1524,7 @@ def skills_analysis_page(analyst_jobs):
         # Plot soft skills using Plotly with improved styling
         if not soft_skill_df.empty:
             fig = plotly_skills_chart(soft_skill_df, f"Top {n_skills} Soft Skills Required", "mint", n_skills)
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True})
+            show_chart(fig)
         else:
             st.info("No soft skills data available.")
         
@@ -1916,7 +1539,7 @@ def skills_analysis_page(analyst_jobs):
         # Plot domains using Plotly with improved styling
         if not domains_df.empty:
             fig = plotly_skills_chart(domains_df, f"Top {n_domains} Industry Domains", "greens", n_domains)
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True})
+            show_chart(fig)
         else:
             st.info("No domain data available.")
         
@@ -1943,6 +1566,107 @@ def skills_analysis_page(analyst_jobs):
     """)
     st.markdown('</div>', unsafe_allow_html=True)
 
+@st.cache_data(show_spinner=False)
+def _build_top_companies_chart(companies):
+    """
+    Count postings for the 15 companies hiring the most and build their bar chart
+    """
+    company_counts = companies.value_counts().nlargest(15)
+    
+    # Use a gradient color scale for companies with improved styling
+    fig = go.Figure(
+        go.Bar(
+            x=company_counts.values,
+            y=company_counts.index,
+            orientation='h',
+            marker=dict(
+                color=company_counts.values,
+                colorscale=[[0.0, '#d4f8f6'], [0.5, '#79a3e4'], [1.0, '#6644af']]
+            ),
+            text=company_counts.values,
+            textposition='outside',
+            hovertemplate='<b>%{y}</b><br>Job Postings: %{x}<extra></extra>'
+        ),
+        layout={
+            **BASE_LAYOUT,
+            'height': 600,
+            'title': "Top 15 Companies Hiring for Data-Related Positions",
+            'xaxis_title': 'Number of Job Postings',
+            'yaxis_title': 'Company',
+            'yaxis_categoryorder': 'total ascending'
+        }
+    )
+    
+    return company_counts, fig
+
+
+@st.cache_data(show_spinner=False)
+def _build_company_charts(company_jobs, selected_company):
+    """
+    Count the selected company's job titles and build its job titles and experience charts;
+    the job titles chart is None when the company has no titles
+    """
+    company_titles = company_jobs['Job Title'].value_counts()
+    
+    # Create job titles chart with Plotly and improved styling
+    title_fig = None
+    if len(company_titles) > 0:
+        title_fig = go.Figure(
+            go.Bar(
+                x=company_titles.values,
+                y=company_titles.index,
+                orientation='h',
+                marker_color='#8f74bd',
+                text=company_titles.values,
+                textposition='outside',
+                hovertemplate='<b>%{y}</b><br>Job Postings: %{x}<extra></extra>'
+            ),
+            layout={
+                **BASE_LAYOUT,
+                'height': 500,
+                'title': f"Job Titles at {selected_company}",
+                'xaxis_title': 'Number of Job Postings',
+                'yaxis_title': 'Job Title',
+                'yaxis_categoryorder': 'total ascending'
+            }
+        )
+    
+    # Create box plot with one box per experience column straight from the company rows,
+    # drawing individual points only for outliers
+    exp_fig = go.Figure([
+        go.Box(
+            y=company_jobs[exp_type],
+            name=exp_type,
+            marker_color=color,
+            boxpoints='outliers'
+        )
+        for exp_type, color in (('exp_min', '#78f2ef'), ('exp_max', '#8f70c3'))
+    ])
+    exp_fig.update_layout(
+        title=f"Experience Requirements at {selected_company}",
+        xaxis_title='Experience Type',
+        yaxis_title='Years',
+        height=500,
+        template='plotly_white',
+        title_font_family="Inter, sans-serif",
+        title_font_size=16,
+        showlegend=False,
+        margin=dict(l=10, r=10, t=50, b=10),
+        plot_bgcolor="white",
+        paper_bgcolor="white",
+        hoverlabel=dict(
+            bgcolor="white",
+            font_size=12,
+            font_family="Inter, sans-serif"
+        )
+    )
+    exp_fig.update_traces(
+        hovertemplate='<b>%{data.name}</b><br>Years: %{y}<extra></extra>'
+    )
+    
+    return company_titles, title_fig, exp_fig
+
+
 # Updated Company Analysis Page function
 def company_analysis_page(filtered_jobs):
     """
@@ -1951,47 +1675,15 @@ def company_analysis_page(filtered_jobs):
     st.markdown('<div id="company-analysis-section" class="section-header">Company Analysis</div>', unsafe_allow_html=True)
     
     try:
-        # Get top companies
-        company_counts = filtered_jobs['Company'].value_counts().nlargest(15)
+        # Get top companies and their chart, cached per dataset
+        company_counts, fig = _build_top_companies_chart(filtered_jobs['Company'])
         
         # Create tabs for different analyses
         tab1, tab2 = st.tabs(["Top Companies", "Company Details"])
         
         with tab1:
             
-            # Use a gradient color scale for companies with improved styling
-            fig = px.bar(
-                x=company_counts.values, 
-                y=company_counts.index, 
-                orientation='h',
-                title="Top 15 Companies Hiring for Data-Related Positions",
-                labels={'x': 'Number of Job Postings', 'y': 'Company'},
-                color=company_counts.values,
-                color_continuous_scale=['#d4f8f6', '#79a3e4', '#6644af'],
-                text=company_counts.values
-            )
-            fig.update_layout(
-                height=600,
-                template='plotly_white',
-                yaxis={'categoryorder': 'total ascending'},
-                coloraxis_showscale=False,
-                title_font_family="Inter, sans-serif",
-                title_font_size=16,
-                margin=dict(l=10, r=10, t=50, b=10),
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                hoverlabel=dict(
-                    bgcolor="white",
-                    font_size=12,
-                    font_family="Inter, sans-serif"
-                )
-            )
-            fig.update_traces(
-                textposition='outside',
-                hovertemplate='<b>%{y}</b><br>Job Postings: %{x}<extra></extra>'
-            )
-            
-            st.plotly_chart(fig, use_container_width=True, config={'displayModeBar': True})
+            show_chart(fig)
         
         with tab2:
             st.markdown('<div class="subsection-header">Company Details</div>', unsafe_allow_html=True)
@@ -2006,119 +1698,37 @@ def company_analysis_page(filtered_jobs):
             # Filter jobs for selected company
             company_jobs = filtered_jobs[filtered_jobs['Company'] == selected_company]
 
-            # Company statistics with modern metric cards
-            col1, col2, col3 = st.columns(3)
+            # Average salaries, shared by the metric cards and the insights below
+            avg_min_salary = company_jobs['Min_Salary'].mean() / 1e6
+            avg_max_salary = company_jobs['Max_Salary'].mean() / 1e6
             
-            with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="value">{len(company_jobs)}</div>
-                    <div class="label">Job Postings</div>
-                </div>
-                """, unsafe_allow_html=True)
-            with col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="value">{company_jobs['Min_Salary'].mean()/1e6:.1f}M</div>
-                    <div class="label">Avg Min Salary (VND)</div>
-                </div>
-                """, unsafe_allow_html=True)
-            with col3:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="value">{company_jobs['Max_Salary'].mean()/1e6:.1f}M</div>
-                    <div class="label">Avg Max Salary (VND)</div>
-                </div>
-                """, unsafe_allow_html=True)
+            # Company statistics with modern metric cards
+            show_metric_cards([
+                (f"{len(company_jobs)}", "Job Postings"),
+                (f"{avg_min_salary:.1f}M", "Avg Min Salary (VND)"),
+                (f"{avg_max_salary:.1f}M", "Avg Max Salary (VND)")
+            ])
             
             # Add space 
             st.markdown("<br>", unsafe_allow_html=True)
 
             
-            # Job titles at company
-            company_titles = company_jobs['Job Title'].value_counts()
-                
-            # Create job titles chart with Plotly and improved styling
-            if len(company_titles) > 0:
-                title_fig = px.bar(
-                    x=company_titles.values, 
-                    y=company_titles.index, 
-                    orientation='h',
-                    title=f"Job Titles at {selected_company}",
-                    labels={'x': 'Number of Job Postings', 'y': 'Job Title'},
-                    color=company_titles.values,
-                    color_discrete_sequence=['#8f74bd'],
-                    text=company_titles.values
-                )
-                title_fig.update_layout(
-                    height=500,
-                    template='plotly_white',
-                    yaxis={'categoryorder': 'total ascending'},
-                    coloraxis_showscale=False,
-                    title_font_family="Inter, sans-serif",
-                    title_font_size=16,
-                    margin=dict(l=10, r=10, t=50, b=10),
-                    plot_bgcolor="white",
-                    paper_bgcolor="white",
-                    hoverlabel=dict(
-                        bgcolor="white",
-                        font_size=12,
-                        font_family="Inter, sans-serif"
-                    )
-                )
-                title_fig.update_traces(
-                    textposition='outside',
-                    hovertemplate='<b>%{y}</b><br>Job Postings: %{x}<extra></extra>'
-                )
-                    
-                st.plotly_chart(title_fig, use_container_width=True, config={'displayModeBar': True})
+            # Job titles and experience charts for the selected company, cached per company
+            company_titles, title_fig, exp_fig = _build_company_charts(
+                company_jobs[['Job Title', 'exp_min', 'exp_max']], selected_company
+            )
+            
+            if title_fig is not None:
+                show_chart(title_fig)
             else:
                 st.write(f"No job titles data available for {selected_company}")
             
-            # Prepare data for box plot
-            company_exp = pd.melt(
-                company_jobs[['Job Title', 'exp_min', 'exp_max']], 
-                id_vars=['Job Title'], 
-                value_vars=['exp_min', 'exp_max'],
-                var_name='Experience Type', 
-                value_name='Years'
-            )
-                
-            # Create box plot with Plotly and improved styling
-            exp_fig = px.box(
-                company_exp, 
-                x='Experience Type', 
-                y='Years',
-                title=f"Experience Requirements at {selected_company}",
-                color='Experience Type',
-                color_discrete_map={'exp_min': '#78f2ef', 'exp_max': '#8f70c3'},
-                points="all"
-            )
-            exp_fig.update_layout(
-                height=500,
-                template='plotly_white',
-                title_font_family="Inter, sans-serif",
-                title_font_size=16,
-                showlegend=False,
-                margin=dict(l=10, r=10, t=50, b=10),
-                plot_bgcolor="white",
-                paper_bgcolor="white",
-                hoverlabel=dict(
-                    bgcolor="white",
-                    font_size=12,
-                    font_family="Inter, sans-serif"
-                )
-            )
-            exp_fig.update_traces(
-                hovertemplate='<b>%{data.name}</b><br>Years: %{y}<extra></extra>'
-            )
-                
-            st.plotly_chart(exp_fig, use_container_width=True, config={'displayModeBar': True})
+            show_chart(exp_fig)
 
             # Insights
             st.markdown("### Key Insights for Selected Company")
             st.markdown(f"""
-            - **Company Overview**: {selected_company} has {len(company_jobs)} job postings with salaries ranging from {company_jobs['Min_Salary'].mean()/1e6:.1f}M to {company_jobs['Max_Salary'].mean()/1e6:.1f}M VND
+            - **Company Overview**: {selected_company} has {len(company_jobs)} job postings with salaries ranging from {avg_min_salary:.1f}M to {avg_max_salary:.1f}M VND
             - **Most Common Job**: The most common position is "{company_titles.index[0] if len(company_titles) > 0 else 'N/A'}" ({company_titles.values[0] if len(company_titles) > 0 else 0} postings)
             - **Experience Level**: Typically requires {company_jobs['exp_min'].median()}-{company_jobs['exp_max'].median()} years of experience
             """)
@@ -2126,7 +1736,16 @@ def company_analysis_page(filtered_jobs):
     except Exception as e:
         st.error(f"Error analyzing company data: {e}")
         st.info("Please check your data files and try refreshing the page.")
-        
+
+
+@st.cache_data(show_spinner=False)
+def top_locations(locations, k=10):
+    """
+    Return the k locations with the most job postings, busiest first
+    """
+    return sort_counts(locations.value_counts()).head(k).index.tolist()
+
+
 # Updated Raw Data Page function
 def raw_data_page(all_jobs, filtered_jobs, analyst_jobs):
     """
@@ -2142,32 +1761,20 @@ def raw_data_page(all_jobs, filtered_jobs, analyst_jobs):
             st.markdown('<div class="subsection-header">All Jobs Dataset</div>', unsafe_allow_html=True)
             
             # Dataset statistics with modern metric cards
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="value">{all_jobs['Company'].nunique()}</div>
-                    <div class="label">Unique Companies</div>
-                </div>
-                """, unsafe_allow_html=True)
-            with col2:
-                st.markdown(f"""
-                <div class="metric-card">
-                    <div class="value">{all_jobs['Job Title'].nunique()}</div>
-                    <div class="label">Unique Job Titles</div>
-                </div>
-                """, unsafe_allow_html=True)
+            show_metric_cards([
+                (f"{all_jobs['Company'].nunique()}", "Unique Companies"),
+                (f"{all_jobs['Job Title'].nunique()}", "Unique Job Titles")
+            ])
             
             # Show sample data
             st.markdown('<div class="subsection-header">Sample Data</div>', unsafe_allow_html=True)
-            st.dataframe(all_jobs, use_container_width=True)
+            show_paginated_dataframe(all_jobs, key="all_jobs")
             
-            # Allow downloading the data with a more prominent button
-            csv = all_jobs.to_csv(index=False)
+            # Allow downloading the data with a more prominent button; the CSV is only
+            # serialized when the button is clicked
             st.download_button(
                 label="📥 Download All Jobs Data as CSV",
-                data=csv,
+                data=functools.partial(all_jobs.to_csv, index=False),
                 file_name="all_jobs.csv",
                 mime="text/csv"
             )
@@ -2178,29 +1785,11 @@ def raw_data_page(all_jobs, filtered_jobs, analyst_jobs):
         st.markdown('<div class="subsection-header">Data-Related Jobs Dataset</div>', unsafe_allow_html=True)
         
         # Dataset statistics with modern metric cards
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="value">{filtered_jobs['Company'].nunique()}</div>
-                <div class="label">Unique Companies</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="value">{filtered_jobs['Job Title'].nunique()}</div>
-                <div class="label">Unique Job Titles</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="value">{filtered_jobs['exp_min'].mean():.1f}</div>
-                <div class="label">Avg Experience Req (Years)</div>
-            </div>
-            """, unsafe_allow_html=True)
+        show_metric_cards([
+            (f"{filtered_jobs['Company'].nunique()}", "Unique Companies"),
+            (f"{filtered_jobs['Job Title'].nunique()}", "Unique Job Titles"),
+            (f"{filtered_jobs['exp_min'].mean():.1f}", "Avg Experience Req (Years)")
+        ])
         
         # Data filters
         st.markdown('<div class="filter-section">', unsafe_allow_html=True)
@@ -2218,22 +1807,15 @@ def raw_data_page(all_jobs, filtered_jobs, analyst_jobs):
         )
         
         # Location filter
-        locations = ['All'] + filtered_jobs['Location'].value_counts().nlargest(10).index.tolist()
-        selected_location = st.selectbox("Location", options=locations)
+        selected_location = st.selectbox("Location", options=['All'] + top_locations(filtered_jobs['Location']))
         st.markdown('</div>', unsafe_allow_html=True)
         
-        # Apply filters
-        filtered_data = filtered_jobs.copy()
-        
-        # Experience filter
-        filtered_data = filtered_data[
-            (filtered_data['exp_min'] >= exp_range[0]) & 
-            (filtered_data['exp_min'] <= exp_range[1])
-        ]
-        
-        # Location filter
+        # Apply the experience and location filters as one mask and select the rows once;
+        # boolean indexing already returns a new frame
+        mask = filtered_jobs['exp_min'].between(exp_range[0], exp_range[1])
         if selected_location != 'All':
-            filtered_data = filtered_data[filtered_data['Location'] == selected_location]
+            mask &= filtered_jobs['Location'] == selected_location
+        filtered_data = filtered_jobs[mask]
         
         # Show filtered data
         st.markdown(f'<div class="subsection-header">Filtered Data ({len(filtered_data)} records)</div>', unsafe_allow_html=True)
@@ -2245,16 +1827,12 @@ def raw_data_page(all_jobs, filtered_jobs, analyst_jobs):
             default=['Job Title', 'Company', 'Location', 'Min_Salary', 'Max_Salary', 'exp_min', 'exp_max', 'Date']
         )
         
-        if display_cols:
-            st.dataframe(filtered_data[display_cols], use_container_width=True)
-        else:
-            st.dataframe(filtered_data, use_container_width=True)
+        show_paginated_dataframe(filtered_data[display_cols] if display_cols else filtered_data, key="filtered_jobs")
         
-        # Allow downloading the filtered data
-        csv = filtered_data.to_csv(index=False)
+        # Allow downloading the filtered data, serialized only when the button is clicked
         st.download_button(
             label="📥 Download Filtered Data as CSV",
-            data=csv,
+            data=functools.partial(filtered_data.to_csv, index=False),
             file_name="filtered_jobs.csv",
             mime="text/csv"
         )
@@ -2263,33 +1841,12 @@ def raw_data_page(all_jobs, filtered_jobs, analyst_jobs):
         if analyst_jobs is not None:
             st.markdown('<div class="subsection-header">Analyst Jobs Dataset</div>', unsafe_allow_html=True)
             
-            # Dataset statistics with modern metric cards
-            col1, col2, col3 = st.columns(3)
-            
-                   # Dataset statistics with modern metric cards
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="value">{analyst_jobs['Company'].nunique()}</div>
-                <div class="label">Unique Companies</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col2:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="value">{analyst_jobs['Job Title'].nunique()}</div>
-                <div class="label">Unique Job Titles</div>
-            </div>
-            """, unsafe_allow_html=True)
-        with col3:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div class="value">{analyst_jobs['exp_min'].mean():.1f}</div>
-                <div class="label">Avg Experience Req (Years)</div>
-            </div>
-            """, unsafe_allow_html=True)
+        # Dataset statistics with modern metric cards
+        show_metric_cards([
+            (f"{analyst_jobs['Company'].nunique()}", "Unique Companies"),
+            (f"{analyst_jobs['Job Title'].nunique()}", "Unique Job Titles"),
+            (f"{analyst_jobs['exp_min'].mean():.1f}", "Avg Experience Req (Years)")
+        ])
         
         # Data filters
         st.markdown('<div class="filter-section">', unsafe_allow_html=True)
@@ -2297,21 +1854,13 @@ def raw_data_page(all_jobs, filtered_jobs, analyst_jobs):
             # Show sample data
         st.markdown('<div class="subsection-header">Sample Data </div>', unsafe_allow_html=True)
             
-            # Format skills columns for display
-        display_data = analyst_jobs.copy()
-           
-            
-        st.dataframe(display_data, use_container_width=True)
-            
-            # Allow downloading the data
-            # Convert skills lists to strings for CSV
-        analyst_jobs_csv = analyst_jobs.copy()
-
+        show_paginated_dataframe(analyst_jobs, key="analyst_jobs")
             
-        csv = analyst_jobs_csv.to_csv(index=False)
+            # Allow downloading the data; skills lists are written as their string form,
+            # serialized only when the button is clicked
         st.download_button(
                 label="📥 Download Analyst Jobs Data as CSV",
-                data=csv,
+                data=functools.partial(analyst_jobs.to_csv, index=False),
                 file_name="analyst_jobs.csv",
                 mime="text/csv"
             )
@@ -2343,35 +1892,6 @@ def main():
         st.markdown("---")
         st.markdown('<div style="padding: 10px 0;">', unsafe_allow_html=True)
         
-        # CSS for custom button styling
-        st.markdown("""
-        <style>
-            div[data-testid="stButton"] button {
-                background-color: #00dbd8; 
-                color: white;
-                font-weight: bold;
-                text-align:left;
-                border: none;
-                transition: all 0.3s;
-            }
-            div[data-testid="stButton"] button[kind="secondary"] {
-                background-color: #ebefef;
-                text-align:left;
-                color: #262730;
-            }
-            div[data-testid="stButton"] button:hover {
-                background-color: #00dbd8;
-                text-align:left;
-                color: white;
-            }
-            div[data-testid="stButton"] button[kind="secondary"]:hover {
-                background-color: #dff8f8;
-                text-align:left;
-                color: #262730;
-            }
-        </style>
-        """, unsafe_allow_html=True)
-        
         # Create modern navigation menu
         for page_name, page_info in pages.items():
             # Check if this is the active page
@@ -2396,12 +1916,12 @@ def main():
         filtered_jobs_path = DATA_DIR / "filtered_data.csv"
         analyst_jobs_path = DATA_DIR / "analyst_jobs.csv"
         
-        all_jobs = load_data(all_jobs_path)
+        # Only read the datasets the current page displays; each cached load still
+        # returns a fresh copy of the frame
+        page = st.session_state.page
+        all_jobs = load_data(all_jobs_path) if page in ALL_JOBS_PAGES else None
         filtered_jobs = load_data(filtered_jobs_path)
-        analyst_jobs = load_data(analyst_jobs_path)
-        
-        if analyst_jobs is not None:
-            analyst_jobs = convert_string_to_list(analyst_jobs, ['Soft Skills', 'Hard Skills', 'Domains'])
+        analyst_jobs = load_skill_data(analyst_jobs_path) if page in ANALYST_JOBS_PAGES else None
     except Exception as e:
         st.error(f"Error loading data: {e}")
         st.info("Please check that the data files exist in the correct location.")
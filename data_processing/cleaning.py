@@ -6,7 +6,28 @@ This module handles cleaning and preprocessing the job data scraped from CareerV
 import re
 import pandas as pd
 import numpy as np
-from datetime import date, datetime, timedelta
+from datetime import date
+
+# Keywords to filter data jobs
+DATA_JOB_KEYWORDS = [
+    'Data', 'Analyst', 'Phân Tích', 'Dữ Liệu', 'Intelligence', 
+    'Machine Learning', 'Scientist', 'Công Nghệ', 'Ai', 'Statistics', 'Research',
+    'Researcher', 'Ecommerce', 'Digital', 'Nghiên Cứu', 'Crm', 'Erp', 'Sap',
+    'System', 'Database', 'Bi', 'Sql', 'Python', 'Etl', 'Insights', 'Analytics',
+    'Artificial Intelligence', 'Clustering', 'Regression', 'Dashboard', 'Excel', 
+    'Power Bi', 'Visualization', 'Reporting', 'Forecasting', 'Quantitative',
+    'Modelling', 'Dự Báo', 'Báo Cáo', 'Mining', 'Analysis', 'Analytic', 'Labeling',
+    'Platform', 'Số Liệu', 'Automation', 'Cntt', 'Software Engineer'
+
+]
+
+# Keywords to filter analyst jobs (also data job keywords, so analyst jobs are data jobs)
+ANALYST_JOB_KEYWORDS = ['Analyst', 'Phân Tích']
+
+# Case-insensitive regex patterns with word boundaries (\b), compiled once at import
+DATA_JOB_PATTERN = re.compile(r'\b(?:' + '|'.join(map(re.escape, DATA_JOB_KEYWORDS)) + r')\b', re.IGNORECASE)
+ANALYST_JOB_PATTERN = re.compile(r'\b(?:' + '|'.join(map(re.escape, ANALYST_JOB_KEYWORDS)) + r')\b', re.IGNORECASE)
+
 
 class JobDataCleaner:
     """Class for cleaning and preprocessing job data."""
@@ -31,8 +52,9 @@ class JobDataCleaner:
         Returns:
             Cleaned DataFrame
         """
-        # Make a copy to avoid modifying the original
-        cleaned_df = df.copy()
+        # Shallow copy: every step assigns whole new columns, so the original is never
+        # modified and its column data does not need to be duplicated
+        cleaned_df = df.copy(deep=False)
         
         # Clean and transform each column
         cleaned_df = self._clean_dates(cleaned_df)
@@ -41,8 +63,13 @@ class JobDataCleaner:
         cleaned_df = self._clean_salary(cleaned_df)
         cleaned_df = self._clean_experience(cleaned_df)
         
-        # Drop duplicates
-        cleaned_df = cleaned_df.drop_duplicates()
+        # Drop duplicates; a posting is identified by its link, so only that column is hashed
+        # instead of every long text field (rows without a link are all kept)
+        if 'Job Link' in cleaned_df.columns:
+            links = cleaned_df['Job Link']
+            cleaned_df = cleaned_df[~(links.duplicated() & links.notna())]
+        else:
+            cleaned_df = cleaned_df.drop_duplicates()
         
         return cleaned_df
     
@@ -51,130 +78,117 @@ class JobDataCleaner:
         # Handle 'Date' column
         df['Date'] = pd.to_datetime(df['Date'], dayfirst=True, errors='coerce')
         
-        # Fill NaN values in 'Expire Date' with 'unknown'
-        df['Expire Date'].fillna('unknown', inplace=True)
-        
-        # Convert "Expire Date" column
-        df["Expire Date"] = df["Expire Date"].apply(self._convert_expire_date)
+        # Convert "Expire Date" column; missing values become 'unknown'
+        df["Expire Date"] = self._convert_expire_dates(df["Expire Date"])
         
         return df
     
-    def _convert_expire_date(self, x):
-        """Convert expire date string to date object."""
-        if isinstance(x, str):
-            if "Hôm nay" in x:
-                return self.today
-            elif "ngày" in x:  # Example: "4 ngày"
-                try:
-                    days = int(re.search(r'(\d+)', x).group(1))
-                    return self.today + timedelta(days=days)
-                except (AttributeError, ValueError):
-                    return 'unknown'
-            elif "-" in x:  # Example: "31-03-2025"
-                try:
-                    return datetime.strptime(x, "%d-%m-%Y").date()
-                except ValueError:
-                    return 'unknown'  # Handle incorrect formats safely
-        return 'unknown'  # Default for other cases
+    def _convert_expire_dates(self, expire_dates):
+        """Convert expire date strings to date objects, or 'unknown' if they cannot be parsed."""
+        text = expire_dates.astype('string')
+        result = pd.Series('unknown', index=expire_dates.index, dtype=object)
+        
+        # "Hôm nay" (today)
+        today_mask = text.str.contains('Hôm nay', regex=False, na=False)
+        result[today_mask] = self.today
+        
+        # Relative dates, e.g. "4 ngày"; entries without a number stay 'unknown'
+        relative_mask = ~today_mask & text.str.contains('ngày', regex=False, na=False)
+        days = pd.to_numeric(text[relative_mask].str.extract(r'(\d+)', expand=False)).dropna()
+        result[days.index] = (pd.Timestamp(self.today) + pd.to_timedelta(days, unit='D')).dt.date
+        
+        # Absolute dates, e.g. "31-03-2025"; incorrect formats stay 'unknown'
+        absolute_mask = ~today_mask & ~relative_mask & text.str.contains('-', regex=False, na=False)
+        dates = pd.to_datetime(text[absolute_mask], format='%d-%m-%Y', errors='coerce').dropna()
+        result[dates.index] = dates.dt.date
+        
+        return result
     
     def _clean_location(self, df):
         """Clean location field."""
-        # Remove unnecessary characters and standardize format
-        df['Location'] = df['Location'].str.replace('\r\n', ',', regex=True)
+        # Remove unnecessary characters and standardize format, once per distinct location
+        df['Location'] = df['Location'].astype('category').str.replace('\r\n', ',', regex=True)
         return df
     
     def _clean_text_fields(self, df):
         """Clean and standardize text fields."""
         # Uppercase first letter
-        for col in ['Job Title', 'Company']:
-            df[col] = df[col].str.title()
+        df['Job Title'] = df['Job Title'].str.title()
+        
+        # Companies and salary phrasings repeat a lot, so their string methods run once per
+        # distinct value of a categorical; the result is plain strings again
+        df['Company'] = df['Company'].astype('category').str.title()
         
         # Clean salary text
-        df['Salary'] = df['Salary'].str.title()
+        df['Salary'] = df['Salary'].astype('category').str.title()
         
         return df
     
     def _clean_salary(self, df):
         """Clean and normalize salary information."""
-        # Extract Min Salary, Max Salary, and Currency using regex
-        df[['Min_Salary', 'Max_Salary', 'Currency']] = df['Salary'].str.extract(
-            r'([\d,]+)?[^\d]+([\d,]+)?\s*([A-Za-z]+)?'
+        # Extract Min Salary, Max Salary, and Currency using regex in one pass
+        parts = df['Salary'].str.extract(r'([\d,]+)?[^\d]+([\d,]+)?\s*([A-Za-z]+)?')
+        
+        # Convert "Tr VND" salaries to VND (multiply by 1,000,000) and "USD" salaries to VND
+        # using the exchange rate, as a single multiplier per row
+        multiplier = (
+            np.where(parts[2] == 'Tr', 1000000, 1)
+            * np.where(df['Salary'].str.contains('Usd', na=False), self.exchange_rate, 1)
         )
+        for i, col in enumerate(['Min_Salary', 'Max_Salary']):
+            df[col] = pd.to_numeric(parts[i].str.replace(',', '', regex=False), errors='coerce') * multiplier
         
-        # Convert salary columns to numeric
-        for col in ['Min_Salary', 'Max_Salary']:
-            df[col] = pd.to_numeric(df[col].str.replace(',', ''), errors='coerce')
-        
-        # Convert "Tr VND" salaries to VND (multiply by 1,000,000)
-        tr_mask = df['Currency'] == 'Tr'
-        df.loc[tr_mask, ['Min_Salary', 'Max_Salary']] = df.loc[tr_mask, ['Min_Salary', 'Max_Salary']] * 1000000
-        
-        # Convert "USD" salaries to VND using exchange rate
-        usd_mask = df['Salary'].str.contains('Usd', na=False)
-        df.loc[usd_mask, ['Min_Salary', 'Max_Salary']] = df.loc[usd_mask, ['Min_Salary', 'Max_Salary']] * self.exchange_rate
-        
-        # Handle "Lên Đến X Tr Vnd" (set Min = mean, Max = X * 1,000,000)
+        # Handle "Lên Đến X Tr Vnd" (set Min = mean, Max = X * 1,000,000); filling these rows
+        # with the mean leaves it unchanged, so it is reused to fill missing minimums below
         up_to_mask = df['Salary'].str.contains('Lên Đến', na=False)
-        mean_min = df['Min_Salary'].mean()
-        df.loc[up_to_mask, 'Min_Salary'] = mean_min
+        min_salary_mean = df['Min_Salary'].mean()
+        df.loc[up_to_mask, 'Min_Salary'] = min_salary_mean
         
         # Extract value and convert to VND for "Lên Đến X Tr Vnd"
         up_to_values = df.loc[up_to_mask, 'Salary'].str.extract(r'Lên Đến (\d+)')[0]
         df.loc[up_to_mask, 'Max_Salary'] = pd.to_numeric(up_to_values, errors='coerce') * 1000000
         
-        # Remove the Currency column
-        df = df.drop(columns=['Currency'])
-        
-        # Replace NaN salaries with the mean
-        mean_min_salary = df['Min_Salary'].mean()
-        df['Min_Salary'].fillna(round(mean_min_salary, 0), inplace=True)
-        
-        mean_max_salary = df['Max_Salary'].mean() 
-        df['Max_Salary'].fillna(round(mean_max_salary, 0), inplace=True)
+        # Replace NaN salaries with the (rounded) column means in one assignment
+        salary_cols = ['Min_Salary', 'Max_Salary']
+        df[salary_cols] = df[salary_cols].fillna({
+            'Min_Salary': round(min_salary_mean, 0),
+            'Max_Salary': round(df['Max_Salary'].mean(), 0),
+        })
         
         return df
     
     def _clean_experience(self, df):
         """Clean and normalize experience information."""
+        # Experience is one of a few dozen phrasings, so parse each distinct value once and
+        # broadcast the results back to the rows through the factorized codes
+        codes, phrasings = pd.factorize(df['Experience'].astype(str))
+        
         # Ensure Experience is a string and remove spaces
-        df['Experience'] = df['Experience'].astype(str).str.title().str.strip()
+        phrasings = pd.Series(phrasings).str.title().str.strip()
         
         # Extract min and max years
-        df[['exp_min', 'exp_max']] = df['Experience'].str.split('-', expand=True)
+        parts = phrasings.str.split('-', n=1, expand=True).reindex(columns=[0, 1]).astype(object)
         
         # Extract numeric values and convert to float
-        df['exp_min'] = pd.to_numeric(
-            df['exp_min'].str.extract(r'(\d+\.?\d*)')[0].str.strip(), 
-            errors='coerce'
-        )
-        
-        df['exp_max'] = pd.to_numeric(
-            df['exp_max'].str.extract(r'(\d+\.?\d*)')[0].str.strip(), 
-            errors='coerce'
-        )
-        
-        # Handle "Chưa Có Kinh Nghiệm" (No Experience)
-        no_exp_mask = df['Experience'].str.contains('Chưa Có Kinh Nghiệm', na=False)
-        df.loc[no_exp_mask, ['exp_min', 'exp_max']] = 0
-        
-        # Handle "Trên X năm" (More than X years)
-        over_mask = df['Experience'].str.contains('Trên', na=False)
-        df.loc[over_mask, 'exp_max'] = np.nan
-        
-        # Handle "Lên Đến X năm" (Up to X years)
-        up_to_mask = df['Experience'].str.contains('Lên Đến', na=False)
-        df.loc[up_to_mask, 'exp_min'] = 0
-        
-        # Fill NaN with mean values
-        mean_exp_min = df['exp_min'].mean()
-        df['exp_min'].fillna(round(mean_exp_min, 0), inplace=True)
-        
-        mean_exp_max = df['exp_max'].mean()
-        df['exp_max'].fillna(round(mean_exp_max, 0), inplace=True)
-        
-        # Final cleanup: ensure all values are proper float
-        df['exp_min'] = df['exp_min'].astype(float)
-        df['exp_max'] = df['exp_max'].astype(float)
+        exp_min = pd.to_numeric(parts[0].str.extract(r'(\d+\.?\d*)')[0], errors='coerce')
+        exp_max = pd.to_numeric(parts[1].str.extract(r'(\d+\.?\d*)')[0], errors='coerce')
+        
+        # Handle "Chưa Có Kinh Nghiệm" (No Experience) and "Lên Đến X năm" (Up to X years)
+        # for the minimum, then "Chưa Có Kinh Nghiệm" and "Trên X năm" (More than X years)
+        # for the maximum
+        no_exp_mask = phrasings.str.contains('Chưa Có Kinh Nghiệm', regex=False)
+        up_to_mask = phrasings.str.contains('Lên Đến', regex=False)
+        over_mask = phrasings.str.contains('Trên', regex=False)
+        exp_min = exp_min.mask(no_exp_mask | up_to_mask, 0)
+        exp_max = exp_max.mask(no_exp_mask, 0).mask(over_mask, np.nan)
+        
+        df['Experience'] = phrasings.to_numpy()[codes]
+        df['exp_min'] = exp_min.to_numpy()[codes]
+        df['exp_max'] = exp_max.to_numpy()[codes]
+        
+        # Fill NaN with mean values and ensure all values are proper float
+        exp_cols = ['exp_min', 'exp_max']
+        df[exp_cols] = df[exp_cols].fillna(df[exp_cols].mean().round(0)).astype(float)
         
         return df
     
@@ -188,31 +202,10 @@ class JobDataCleaner:
         Returns:
             Filtered DataFrame with only data-related jobs
         """
-        # Keywords to filter data jobs
-        keywords = [
-            'Data', 'Analyst', 'Phân Tích', 'Dữ Liệu', 'Intelligence', 
-            'Machine Learning', 'Scientist', 'Công Nghệ', 'Ai', 'Statistics', 'Research',
-            'Researcher', 'Ecommerce', 'Digital', 'Nghiên Cứu', 'Crm', 'Erp', 'Sap',
-            'System', 'Database', 'Bi', 'Sql', 'Python', 'Etl', 'Insights', 'Analytics',
-            'Artificial Intelligence', 'Clustering', 'Regression', 'Dashboard', 'Excel', 
-            'Power Bi', 'Visualization', 'Reporting', 'Forecasting', 'Quantitative',
-            'Modelling', 'Dự Báo', 'Báo Cáo', 'Mining', 'Analysis', 'Analytic', 'Labeling',
-            'Platform', 'Số Liệu', 'Automation', 'Cntt', 'Software Engineer'
-        ]
-        
-        # Create a regex pattern with word boundaries (\b)
-        pattern = r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b'
-        
         # Filter rows that contain at least one whole-word keyword in 'Job Title'
-        return df[df['Job Title'].str.contains(pattern, case=False, na=False, regex=True)]
+        return df[df['Job Title'].str.contains(DATA_JOB_PATTERN, na=False)]
     
     def filter_analyst_jobs(self, df):
-        # Keywords to filter analyst jobs
-        keywords=['Analyst','Phân Tích']
-
-        # Create a regex pattern with word boundaries (\b)
-        pattern = r'\b(?:' + '|'.join(map(re.escape, keywords)) + r')\b'
-
         # Filter rows that contain at least one whole-word keyword in 'Job Title'
-        return df[df['Job Title'].str.contains(pattern, case=False, na=False, regex=True)]
+        return df[df['Job Title'].str.contains(ANALYST_JOB_PATTERN, na=False)]
     
@@ -7,6 +7,8 @@ particularly focusing on skills extraction.
 import re
 import pandas as pd
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import List, Dict, Set, Optional, Union, Tuple
 import warnings
 
@@ -27,6 +29,9 @@ class SkillsExtractor:
         self.use_translator = use_translator
         self.translator = None
         
+        # Translations of texts seen so far, keyed by the original text
+        self._translations = {}
+        
         if use_translator:
             try:
                 from googletrans import Translator
@@ -44,6 +49,11 @@ class SkillsExtractor:
         self.soft_skills_lower = {skill.lower(): skill for skill in self.soft_skills}
         self.hard_skills_lower = {skill.lower(): skill for skill in self.hard_skills}
         self.domains_lower = {skill.lower(): skill for skill in self.domains}
+        
+        # Compile the whole-word pattern for each skill once
+        self.soft_skills_patterns = self._compile_skill_patterns(self.soft_skills_lower)
+        self.hard_skills_patterns = self._compile_skill_patterns(self.hard_skills_lower)
+        self.domains_patterns = self._compile_skill_patterns(self.domains_lower)
     
     def _load_soft_skills(self) -> List[str]:
         """Load the list of soft skills."""
@@ -94,22 +104,61 @@ class SkillsExtractor:
         if not self.use_translator or not self.translator:
             return text
         
+        # Non-string cells (e.g. requirements parsed as numbers) have nothing to translate
+        if not isinstance(text, str):
+            return str(text)
+        
+        # Written Vietnamese uses diacritics, so pure ASCII text is left as is without
+        # a language detection round trip
+        if text.isascii():
+            return text
+        
+        # Reuse earlier results; failed translations are not cached so they are retried
+        if text in self._translations:
+            return self._translations[text]
+        
         try:
             detected_lang = self.translator.detect(text).lang
             if detected_lang == "vi":  # If text is in Vietnamese, translate it
-                return self.translator.translate(text, src="vi", dest="en").text
+                translated = self.translator.translate(text, src="vi", dest="en").text
+            else:
+                translated = text
+            self._translations[text] = translated
+            return translated
         except Exception as e:
             print(f"Translation error: {e}")
         
-        return text  # Return original if not Vietnamese or translation fails
+        return text  # Return original if translation fails
+    
+    def translate_texts(self, texts: pd.Series, max_workers: int = 8) -> pd.Series:
+        """
+        Translate a column of texts, calling the translator once per distinct text.
+        
+        Args:
+            texts: Series of texts to translate
+            max_workers: Number of translation requests to run concurrently
+            
+        Returns:
+            Series of translated texts, with missing values as empty strings
+        """
+        # Job requirements are often reposted verbatim, so each distinct text is detected
+        # and translated only once
+        unique_texts = texts.dropna().unique()
+        
+        # Translation is network-bound, so overlap the requests on a thread pool
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            translations = dict(zip(unique_texts, executor.map(self.translate_text, unique_texts)))
+        return texts.map(translations).fillna("")
     
-    def extract_skills(self, text: str, skill_dict: Dict[str, str]) -> List[str]:
+    def extract_skills(self, text: str, skill_dict: Dict[str, str], translate: bool = True) -> List[str]:
         """
         Extract and count skills from text.
         
         Args:
             text: Text to extract skills from
             skill_dict: Dictionary of skills to search for
+            translate: Whether to translate the text first; pass False for text
+                that has already been translated
             
         Returns:
             List of found skills
@@ -118,16 +167,54 @@ class SkillsExtractor:
             return []
         
         # Translate if needed
-        processed_text = self.translate_text(text).lower()
+        processed_text = (self.translate_text(text) if translate else text).lower()
         found_skills = []
         
-        # Use regex with word boundaries to find whole-word matches
-        for skill_lower, skill_original in skill_dict.items():
-            matches = re.findall(rf'\b{re.escape(skill_lower)}\b', processed_text)
-            found_skills.extend([skill_original] * len(matches))
+        # Use regex with word boundaries to find whole-word matches, skipping the regex
+        # for skills that do not occur in the text at all
+        for skill_lower, skill_original, pattern in self._get_skill_patterns(skill_dict):
+            if skill_lower in processed_text:
+                matches = pattern.findall(processed_text)
+                found_skills.extend([skill_original] * len(matches))
         
         return found_skills
     
+    def _compile_skill_patterns(self, skill_dict: Dict[str, str]) -> List[Tuple[str, str, re.Pattern]]:
+        """
+        Compile the whole-word pattern for each skill in a dictionary.
+        
+        Args:
+            skill_dict: Dictionary of skills to search for
+            
+        Returns:
+            List of (lowercase skill, original skill, compiled pattern) tuples
+        """
+        return [
+            (skill_lower, skill_original, re.compile(rf'\b{re.escape(skill_lower)}\b'))
+            for skill_lower, skill_original in skill_dict.items()
+        ]
+    
+    def _get_skill_patterns(self, skill_dict: Dict[str, str]) -> List[Tuple[str, str, re.Pattern]]:
+        """
+        Get the compiled whole-word pattern for each skill in a dictionary.
+        
+        Args:
+            skill_dict: Dictionary of skills to search for
+            
+        Returns:
+            List of (lowercase skill, original skill, compiled pattern) tuples
+        """
+        # The built-in dictionaries were compiled in __init__; any other dictionary is
+        # compiled for this call
+        for known_dict, patterns in (
+            (self.soft_skills_lower, self.soft_skills_patterns),
+            (self.hard_skills_lower, self.hard_skills_patterns),
+            (self.domains_lower, self.domains_patterns),
+        ):
+            if skill_dict is known_dict:
+                return patterns
+        return self._compile_skill_patterns(skill_dict)
+    
     def extract_all_skills(self, df: pd.DataFrame, text_column: str = "Job Requirements") -> pd.DataFrame:
         """
         Extract all types of skills from a text column in the DataFrame.
@@ -139,28 +226,29 @@ class SkillsExtractor:
         Returns:
             DataFrame with additional columns for extracted skills
         """
-        # Make a copy to avoid modifying the original
-        result_df = df.copy()
+        # Shallow copy: every step assigns whole new columns, so the original is never
+        # modified and its column data does not need to be duplicated
+        result_df = df.copy(deep=False)
         
         # Add translated column if translator is available
         if self.use_translator and self.translator:
-            result_df["Translated " + text_column] = result_df[text_column].apply(self.translate_text)
+            result_df["Translated " + text_column] = self.translate_texts(result_df[text_column])
             source_column = "Translated " + text_column
         else:
             source_column = text_column
         
-        # Extract skills
-        result_df["Soft Skills"] = result_df[source_column].apply(
-            lambda x: self.extract_skills(x, self.soft_skills_lower)
-        )
-        
-        result_df["Hard Skills"] = result_df[source_column].apply(
-            lambda x: self.extract_skills(x, self.hard_skills_lower)
-        )
+        # Extract skills once per distinct text and map the results back to the rows; the
+        # source text is already translated, so skip per-skill-type translation round trips
+        texts = result_df[source_column]
+        unique_texts = texts.dropna().unique()
         
-        result_df["Domains"] = result_df[source_column].apply(
-            lambda x: self.extract_skills(x, self.domains_lower)
-        )
+        for column, skill_dict in (
+            ("Soft Skills", self.soft_skills_lower),
+            ("Hard Skills", self.hard_skills_lower),
+            ("Domains", self.domains_lower),
+        ):
+            skills = {text: self.extract_skills(text, skill_dict, translate=False) for text in unique_texts}
+            result_df[column] = [skills.get(text, []) for text in texts]
         
         return result_df
     
@@ -175,9 +263,8 @@ class SkillsExtractor:
         Returns:
             DataFrame with skills counts sorted by frequency
         """
-        # Flatten and count occurrences
-        all_skills = [skill for skills_list in df[skills_column] for skill in skills_list]
-        skill_counts = Counter(all_skills)
+        # Flatten and count occurrences in C without building an intermediate list
+        skill_counts = Counter(chain.from_iterable(df[skills_column]))
         
         # Convert to DataFrame for visualization
         return pd.DataFrame(skill_counts.items(), columns=["Skill", "Count"]).sort_values(
@@ -85,7 +85,7 @@ def clean_data(df=None, args=None):
     if df is None:
         input_path = args.input or RAW_DATA_PATH
         print(f"Loading data from {input_path}")
-        df = pd.read_csv(input_path)
+        df = pd.read_csv(input_path, engine="pyarrow")
     
     # Initialize the cleaner
     cleaner = JobDataCleaner(exchange_rate=USD_TO_VND_RATE)
@@ -96,8 +96,9 @@ def clean_data(df=None, args=None):
     # Filter data jobs
     filtered_df = cleaner.filter_data_jobs(cleaned_df)
 
-    # Filter data analyst jobs
-    analyst_df = cleaner.filter_analyst_jobs(cleaned_df)
+    # Filter data analyst jobs; the analyst keywords are also data job keywords, so only the
+    # data jobs need to be scanned
+    analyst_df = cleaner.filter_analyst_jobs(filtered_df)
 
     # Save the processed data
     cleaned_df.to_csv(PROCESSED_DATA_PATH, index=False)
@@ -124,7 +125,7 @@ def analyze_data(df=None, args=None):
     if df is None:
         input_path = args.input or ANALYST_DATA_PATH
         print(f"Loading data from {input_path}")
-        df = pd.read_csv(input_path)
+        df = pd.read_csv(input_path, engine="pyarrow")
     
     # Initialize the skills extractor
     skills_extractor = SkillsExtractor(use_translator=True)
@@ -165,7 +166,11 @@ def visualize_data(df=None, skills_data=None, args=None):
     if df is None:
         input_path = args.input or FILTERED_DATA_PATH
         print(f"Loading data from {input_path}")
-        df = pd.read_csv(input_path)
+        # Only load the columns the plots use, skipping the long description texts
+        df = pd.read_csv(input_path, engine="pyarrow", usecols=[
+            'Job Title', 'Company', 'Location', 'Date', 'Job Level', 'Job Type',
+            'Min_Salary', 'Max_Salary', 'exp_min', 'exp_max'
+        ])
         
 
     # Initialize the visualizer
@@ -301,7 +306,9 @@ def main():
         skills_data = (soft_skill_df, hard_skill_df, domains_df)
     
     if run_visualize:
-        skills_data=analyze_data(df_analyst, args)
+        # Reuse the skills from the analyze stage; only extract them when it did not run
+        if skills_data is None:
+            skills_data = analyze_data(df_analyst, args)
         visualize_data(df_filtered, skills_data, args)
     
     # Print execution summary